@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Python API doc generation pipeline on a synthetic package.
+- Builds a fake `hoodini` package with N modules x M functions (plus a Click CLI)
+- Times each stage of generate-api-markdown.py separately
+Prints a JSON report with wall time, peak RSS and a per-stage breakdown.
+"""
+
+import io
+import sys
+import json
+import time
+import resource
+import tempfile
+import statistics
+import importlib.util
+from contextlib import redirect_stdout
+from pathlib import Path
+
+GENERATOR_PATH = Path(__file__).resolve().parent / "generate-api-markdown.py"
+
+# Folders of the synthetic package, cycled through so every FOLDER_CATEGORY_MAP category gets modules
+PACKAGE_FOLDERS = ["config", "pipeline", "download", "extra_tools", "models", "utils", "misc"]
+
+
+def load_generator():
+    """Import generate-api-markdown.py (its name is not a valid module name)."""
+    spec = importlib.util.spec_from_file_location("generate_api_markdown", GENERATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def function_source(name: str) -> str:
+    return f'''
+
+def {name}(path: str, threads: int = 4, options: dict | None = None) -> list[str]:
+    """Process {name} inputs.
+
+    Longer description of what {name} does, spanning
+    more than one line.
+
+    Args:
+        path: Input path.
+        threads: Number of threads.
+        options: Extra options.
+
+    Returns:
+        list[str]: Output paths.
+    ----------
+    Example:
+        >>> {name}("in.fasta")
+    """
+'''
+
+
+def class_source(name: str, methods: int) -> str:
+    src = f'''
+
+class {name}:
+    """A {name} record.
+
+    Attributes:
+        value: Stored value.
+    """
+'''
+    for m in range(methods):
+        src += f'''
+    def method_{m}(self, x: int = 0) -> int:
+        """Method {m} of {name}."""
+        return x
+'''
+    return src
+
+
+def cli_source(commands: int, options: int) -> str:
+    src = '''"""Command-line interface."""
+import click
+
+
+@click.group()
+def cli():
+    """Synthetic CLI."""
+
+
+@cli.group()
+def utils():
+    """Utility commands."""
+'''
+    for c in range(commands):
+        parent = "utils" if c % 2 else "cli"
+        src += f'\n\n@{parent}.command("cmd-{c}")\n'
+        for o in range(options):
+            if o % 3 == 0:
+                src += f'@click.option("--flag-{o}", is_flag=True, help="Flag {o}")\n'
+            elif o % 3 == 1:
+                src += f'@click.option("--mode-{o}", type=click.Choice(["a", "b", "c"]), help="Mode {o}")\n'
+            else:
+                src += f'@click.option("--value-{o}", "-v{o}", default=1, help="Value {o}")\n'
+        src += f'@click.argument("input_{c}")\n'
+        src += f'def cmd_{c}(**kwargs):\n    """Run command {c}."""\n'
+    return src
+
+
+def build_synthetic_package(root: Path, modules: int, functions: int, classes: int,
+                            commands: int, options: int) -> Path:
+    """Write a synthetic `hoodini` package under root and return its search path."""
+    pkg = root / "hoodini"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text('"""Synthetic package."""\n__version__ = "0.0.0"\n')
+    (pkg / "cli.py").write_text(cli_source(commands, options))
+
+    for folder in PACKAGE_FOLDERS:
+        (pkg / folder).mkdir()
+        (pkg / folder / "__init__.py").write_text(f'"""The {folder} package."""\n')
+
+    for i in range(modules):
+        folder = PACKAGE_FOLDERS[i % len(PACKAGE_FOLDERS)]
+        src = f'"""Module {i} in {folder}.\n\nDetails about module {i}.\n"""\n'
+        for f in range(functions):
+            src += function_source(f"func_{i}_{f}")
+        for c in range(classes):
+            src += class_source(f"Model{i}_{c}", methods=3)
+        (pkg / folder / f"mod_{i}.py").write_text(src)
+
+    return root
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_stages(gen, search_path: str) -> dict[str, float]:
+    """Run every stage once and return {stage: seconds}."""
+    from griffe import load, Function
+
+    timings = {}
+
+    def timed(stage, fn):
+        start = time.perf_counter()
+        result = fn()
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    module = timed("griffe_load", lambda: load("hoodini", search_paths=[search_path]))
+    modules_by_path = timed("collect_modules", lambda: gen.collect_python_modules(module, "hoodini"))
+
+    objects = []
+    for info in modules_by_path.values():
+        objects.extend(info["functions"])
+        for cls in info["classes"]:
+            objects.append(cls)
+            objects.extend(m for m in cls.members.values() if isinstance(m, Function))
+    docstrings = [gen.format_docstring(obj) for obj in objects]
+
+    timed("parse_docstring_sections", lambda: [gen.parse_docstring_sections(doc) for doc in docstrings])
+    timed("format_docstring_rich", lambda: [gen.format_docstring_rich(obj) for obj in objects])
+
+    categories, uncategorized = gen.group_modules_by_category("hoodini", modules_by_path)
+    cli_functions = [
+        (path, func)
+        for (cat_name, _), paths in categories.items() if cat_name == "CLI Commands"
+        for path in paths
+        for func in modules_by_path[path]["functions"]
+    ]
+    timed("build_click_command_tree", lambda: gen.build_click_command_tree(cli_functions))
+
+    def assemble():
+        md = gen.format_python_header_md("hoodini", module)
+        symbols = []
+        for cat_name, cat_desc in gen.FOLDER_CATEGORY_MAP["hoodini"].values():
+            paths = categories.get((cat_name, cat_desc))
+            if paths:
+                md.extend(gen.format_python_category_md(cat_name, cat_desc, paths, modules_by_path,
+                                                        symbols=symbols))
+        if uncategorized:
+            md.extend(gen.format_python_uncategorized_md(uncategorized, modules_by_path, symbols=symbols))
+        return "\n".join(md)
+
+    text = timed("markdown_assembly", assemble)
+    timings["output_bytes"] = len(text.encode())
+    return timings
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark the API markdown generator on a synthetic package")
+    parser.add_argument("--modules", "-n", type=int, default=50, help="Number of modules (default: 50)")
+    parser.add_argument("--functions", "-m", type=int, default=20, help="Functions per module (default: 20)")
+    parser.add_argument("--classes", type=int, default=2, help="Classes per module (default: 2)")
+    parser.add_argument("--commands", type=int, default=20, help="Click commands in cli.py (default: 20)")
+    parser.add_argument("--options", type=int, default=10, help="Options per Click command (default: 10)")
+    parser.add_argument("--repeat", "-r", type=int, default=3, help="Runs per stage (default: 3)")
+    parser.add_argument("--output", "-o", help="Write the JSON report here instead of stdout")
+
+    args = parser.parse_args()
+
+    gen = load_generator()
+    runs = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        search_path = build_synthetic_package(Path(tmp), args.modules, args.functions, args.classes,
+                                              args.commands, args.options)
+
+        wall_start = time.perf_counter()
+        for _ in range(args.repeat):
+            runs.append(run_stages(gen, str(search_path)))
+
+        # End to end, without the render cache (its progress output would corrupt the JSON)
+        end_to_end = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                gen.generate_python_api("hoodini", [str(search_path)], str(Path(tmp) / "out" / "reference.md"),
+                                        cache_dir=None)
+            end_to_end.append(time.perf_counter() - start)
+        wall_seconds = time.perf_counter() - wall_start
+
+    stages = {}
+    for stage in runs[0]:
+        if stage == "output_bytes":
+            continue
+        samples = [run[stage] for run in runs]
+        stages[stage] = {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "max": max(samples),
+        }
+
+    report = {
+        "params": {
+            "modules": args.modules,
+            "functions_per_module": args.functions,
+            "classes_per_module": args.classes,
+            "click_commands": args.commands,
+            "options_per_command": args.options,
+            "repeat": args.repeat,
+        },
+        "python": sys.version.split()[0],
+        "wall_seconds": wall_seconds,
+        "peak_rss_mb": peak_rss_mb(),
+        "output_bytes": runs[0]["output_bytes"],
+        "stages": stages,
+        "generate_python_api": {
+            "min": min(end_to_end),
+            "median": statistics.median(end_to_end),
+            "max": max(end_to_end),
+        },
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
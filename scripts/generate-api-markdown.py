@@ -6,8 +6,11 @@ Generate API reference markdown from Python/TypeScript source code.
 Output is clean markdown compatible with Nextra/MDX.
 """
 
+import os
 import sys
 import json
+import hashlib
+import time
 import subprocess
 import re
 from pathlib import Path
@@ -35,108 +38,471 @@ FOLDER_CATEGORY_MAP = {
 }
 
 
+# ============ SYMBOL INDEX ============
+
+def first_line(text: str) -> str:
+    return text.strip().split("\n")[0].strip() if text else ""
+
+
+def unescape_md(text: str) -> str:
+    """Undo the MDX escaping applied to signatures."""
+    return text.replace("\\<", "<").replace("\\>", ">").replace("\\{", "{").replace("\\}", "}")
+
+
+def add_symbol(symbols: list | None, line: int, name: str, kind: str, signature: str = "", summary: str = "",
+               **fields):
+    """
+    Record an index entry. line is the index in the md list of the heading that
+    documents the symbol; it is turned into an anchor once the page is assembled.
+    Extra keyword fields (e.g. choices of a CLI option) are stored as is.
+    """
+    if symbols is None:
+        return
+    symbols.append({
+        "name": name,
+        "kind": kind,
+        "signature": unescape_md(signature),
+        "summary": summary,
+        **fields,
+        "line": line,
+    })
+
+
+def extend_md(md: list, lines: list, symbols: list | None = None, line_symbols: list | None = None):
+    """Append rendered lines to md, shifting their index entries to the new positions."""
+    if symbols is not None and line_symbols:
+        symbols.extend({**sym, "line": sym["line"] + len(md)} for sym in line_symbols)
+    md.extend(lines)
+
+
+class HeadingSlugger:
+    """Heading anchors as generated by github-slugger, which Nextra uses for heading ids."""
+
+    def __init__(self):
+        self.seen = {}
+
+    def slug(self, text: str) -> str:
+        base = re.sub(r"[^\w\- ]", "", text.lower()).replace(" ", "-")
+        slug = base
+        while slug in self.seen:
+            self.seen[base] += 1
+            slug = f"{base}-{self.seen[base]}"
+        self.seen[slug] = 0
+        return slug
+
+
+def symbol_index_path(output_path: str | Path) -> Path:
+    """reference.md -> reference.symbols.json"""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.symbols.json")
+
+
+def write_symbol_index(output_path: str | Path, source: str, symbols: list[dict]) -> Path:
+    """
+    Write the symbol index next to the markdown output, sorted by name so
+    consumers can do prefix lookups with a binary search.
+    """
+    index_path = symbol_index_path(output_path)
+    index = {
+        "source": source,
+        "symbols": sorted(symbols, key=lambda s: (s["name"], s["kind"])),
+    }
+    write_if_changed(index_path, json.dumps(index, separators=(",", ":")))
+    print(f"Generated {index_path} ({len(symbols)} symbols)")
+    return index_path
+
+
+# ============ OUTPUT ============
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+# Written next to split pages: the page names the generator owns in that directory
+GENERATED_PAGES_FILE = ".api-pages.json"
+
+
+def temp_path_for(path: Path) -> Path:
+    """Hidden sibling of path used to stage a write before the atomic rename."""
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def write_if_changed(path: str | Path, text: str) -> bool:
+    """Write text unless the file already has it, so watchers and dev servers see no spurious change."""
+    path = Path(path)
+    if path.is_file() and path.read_text() == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = temp_path_for(path)
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def is_section_heading(element: str) -> bool:
+    """True for the single-line "## Title" elements that open a top-level section."""
+    return element.startswith("## ") and element.rstrip("\n").count("\n") == 0
+
+
+class MarkdownWriter:
+    """
+    Stream md elements (joined with newlines) to a temporary file next to path,
+    renamed into place by commit(). Headings are slugged as they are written, so
+    index entries get their anchor without keeping the page in memory.
+    With promote=True, headings below h1 move up one level (### -> ##).
+    """
+
+    def __init__(self, path: str | Path, page: str = "", promote: bool = False):
+        self.path = Path(path)
+        self.page = page
+        self.promote = promote
+        self.symbols = []
+        self.count = 0
+        self.slugger = HeadingSlugger()
+        self.in_code = False
+        self.digest = hashlib.sha256()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp_path = temp_path_for(self.path)
+        self.file = open(self.tmp_path, "w")
+
+    def scan_headings(self, element: str) -> tuple[str, str | None]:
+        """
+        Slug (and promote) every heading of element outside code fences.
+        Returns (element, anchor) where anchor is set if the element's first line is a heading.
+        """
+        anchor = None
+        lines = element.split("\n")
+        for n, line in enumerate(lines):
+            if line.strip().startswith("```"):
+                self.in_code = not self.in_code
+                continue
+            if self.in_code:
+                continue
+            match = HEADING_RE.match(line)
+            if match:
+                if self.promote and len(match.group(1)) > 1:
+                    lines[n] = line[1:]
+                slug = self.slugger.slug(match.group(2).replace("`", ""))
+                if n == 0:
+                    anchor = slug
+        return "\n".join(lines) if self.promote else element, anchor
+
+    def write(self, element: str, symbols=()):
+        """Append one md element. symbols are the index entries documented by this element."""
+        element, anchor = self.scan_headings(element)
+        text = f"\n{element}" if self.count else element
+        self.file.write(text)
+        self.digest.update(text.encode())
+        self.count += 1
+
+        for sym in symbols:
+            entry = {k: v for k, v in sym.items() if k != "line"}
+            entry["anchor"] = f"{self.page}#{anchor}" if anchor is not None else self.page
+            self.symbols.append(entry)
+
+    def end(self):
+        """Stop writing; the page stays staged until commit() or abort()."""
+        self.file.close()
+
+    def commit(self) -> bool:
+        """Move the page into place, unless the file already has this content. Returns True if written."""
+        self.end()
+        if self.path.is_file() and hash_file(self.path) == self.digest.hexdigest():
+            self.tmp_path.unlink()
+            return False
+        os.replace(self.tmp_path, self.path)
+        return True
+
+    def abort(self):
+        self.end()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+class ReferenceOutput:
+    """
+    Destination of a generated reference, fed section by section with write(md, symbols)
+    where each symbol's "line" indexes md. Use as a context manager: the outputs are
+    moved into place when the block completes, and left untouched if it raises.
+
+    With split=True, output_path is a directory that receives index.md (the header
+    plus links to every section), one page per "## Section" with its headings moved
+    up a level, and index.symbols.json. Each page is finished as soon as the next
+    section starts, and pages whose content is unchanged are not rewritten. The
+    generated pages are added to the directory's Nextra _meta.json, keeping any
+    hand-written entries, and recorded in GENERATED_PAGES_FILE, so that only
+    pages a previous run generated are removed once they are gone.
+
+    After the block, outputs is {written_path: sha256}.
+    """
+
+    def __init__(self, output_path: str | Path, source: str, split: bool = False):
+        self.output_path = Path(output_path)
+        self.source = source
+        self.split = split
+        self.outputs = {}
+        self.symbols = []
+        # Split mode: elements before the first section (for index.md), section pages,
+        # and "---" separators held back until we know whether a section follows
+        self.header = []
+        self.pages = []
+        self.pending = []
+        self.page_slugger = HeadingSlugger()
+        self.writer = None if split else MarkdownWriter(self.output_path)
+        self.staged = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.end_page()
+            for writer in self.staged:
+                writer.abort()
+        return False
+
+    def write(self, md: list[str], symbols: list[dict] | None = None):
+        by_line = {}
+        for sym in symbols or ():
+            by_line.setdefault(sym["line"], []).append(sym)
+        for i, element in enumerate(md):
+            self.write_element(element, by_line.get(i, ()))
+
+    def write_element(self, element: str, symbols=()):
+        if not self.split:
+            self.writer.write(element, symbols)
+        elif is_section_heading(element):
+            # The "---" separator before a section belongs to neither page
+            self.flush_pending(keep_last=False)
+            self.end_page()
+            title = element[3:].strip()
+            name = self.page_slugger.slug(title.replace("`", ""))
+            self.pages.append({"name": name, "title": title})
+            self.writer = MarkdownWriter(self.output_path / f"{name}.md", page=name, promote=True)
+            self.writer.write(f"# {title}\n", symbols)
+        elif element == "---\n":
+            self.pending.append((element, symbols))
+        else:
+            self.flush_pending()
+            self.append(element, symbols)
+
+    def append(self, element: str, symbols=()):
+        if self.writer is None:
+            self.header.append((element, symbols))
+        else:
+            self.writer.write(element, symbols)
+
+    def flush_pending(self, keep_last: bool = True):
+        held = self.pending if keep_last else self.pending[:-1]
+        for element, symbols in held:
+            self.append(element, symbols)
+        self.pending = []
+
+    def end_page(self):
+        if self.writer is not None:
+            self.writer.end()
+            self.staged.append(self.writer)
+            self.writer = None
+
+    def commit_staged(self) -> list[Path]:
+        """Move every staged page into place. Returns the paths that changed."""
+        changed = []
+        for writer in self.staged:
+            if writer.commit():
+                changed.append(writer.path)
+            self.symbols.extend(writer.symbols)
+            self.outputs[str(writer.path.resolve())] = writer.digest.hexdigest()
+        self.staged = []
+        return changed
+
+    def close(self):
+        if not self.split:
+            self.end_page()
+            self.commit_staged()
+            print(f"Generated {self.output_path}")
+            self.record(write_symbol_index(self.output_path, self.source, self.symbols))
+            return
+
+        self.flush_pending()
+        self.end_page()
+
+        index = MarkdownWriter(self.output_path / "index.md", page="index")
+        self.staged.append(index)
+        for element, symbols in self.header:
+            index.write(element, symbols)
+        if self.pages:
+            index.write("## Sections\n")
+            for page in self.pages:
+                index.write(f"- [{page['title']}](./{page['name']})")
+            index.write("")
+        changed = [path for path in self.commit_staged() if path != index.path]
+
+        # Drop pages an earlier run generated that are gone now; never touch other files
+        generated = {"index": "Overview", **{page["name"]: page["title"].replace("`", "") for page in self.pages}}
+        marker_file = self.output_path / GENERATED_PAGES_FILE
+        try:
+            old_generated = set(json.loads(marker_file.read_text())["pages"])
+        except (OSError, ValueError, KeyError, TypeError):
+            old_generated = set()
+        for stale in old_generated - set(generated):
+            (self.output_path / f"{stale}.md").unlink(missing_ok=True)
+        write_if_changed(marker_file, json.dumps({"source": self.source, "pages": list(generated)}, indent=2) + "\n")
+        self.record(marker_file)
+
+        # Nextra navigation: generated pages in section order, then hand-written entries
+        meta_file = self.output_path / "_meta.json"
+        try:
+            old_meta = json.loads(meta_file.read_text())
+        except (OSError, ValueError):
+            old_meta = {}
+        meta = {**generated, **{key: value for key, value in old_meta.items()
+                                if key not in generated and key not in old_generated}}
+        write_if_changed(meta_file, json.dumps(meta, indent=2) + "\n")
+        self.record(meta_file)
+
+        print(f"Generated {self.output_path}/ ({len(self.pages)} pages, {len(changed)} changed)")
+        self.record(write_symbol_index(index.path, self.source, self.symbols))
+
+    def record(self, path: Path):
+        self.outputs[str(path.resolve())] = hash_file(path)
+
+
 # ============ CLICK CLI PARSER ============
 
-def is_click_decorated(func) -> bool:
-    """Check if a griffe Function has Click decorators."""
+CLICK_COMMAND_NAME_RE = re.compile(r'\.command\(["\']([^"\']+)["\']\)')
+CLICK_PARENT_RE = re.compile(r'@?(\w+)\.(command|group)')
+CLICK_OPTION_NAMES_RE = re.compile(r'["\'](-{1,2}[\w-]+)["\']')
+CLICK_HELP_RE = re.compile(r'help\s*=\s*(["\'])((?:\\.|(?!\1).)+)\1')
+CLICK_FLAG_RE = re.compile(r'is_flag\s*=\s*True')
+CLICK_CHOICE_RE = re.compile(r'type\s*=\s*click\.Choice\(\[([^\]]+)\]\)')
+CLICK_ARGUMENT_RE = re.compile(r'argument\(["\'](\w+)["\']', re.IGNORECASE)
+MUTUALLY_EXCLUSIVE_RE = re.compile(r'mutually_exclusive\s*=\s*[\[(]([^\])]*)[\])]')
+QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+
+
+def decorator_strings(func) -> list[str]:
+    """Render each decorator expression once, e.g. "click.option('--force', is_flag=True)"."""
     if not hasattr(func, 'decorators') or not func.decorators:
-        return False
-    for dec in func.decorators:
-        dec_str = str(dec.value) if hasattr(dec, 'value') else str(dec)
+        return []
+    return [str(dec.value) if hasattr(dec, 'value') else str(dec) for dec in func.decorators]
+
+
+def click_param_name(names: list[str]) -> str:
+    """Parameter name Click derives from option names: the first long name, else the first short one."""
+    long_names = [n for n in names if n.startswith("--")]
+    name = long_names[0] if long_names else names[0]
+    return name.lstrip("-").replace("-", "_")
+
+
+def parse_click_option(dec_str: str) -> dict | None:
+    """Parse one @click.option / @group.option decorator string."""
+    opt = {"type": "option"}
+
+    # Extract option names (--name, -n)
+    names = CLICK_OPTION_NAMES_RE.findall(dec_str)
+    if not names:
+        return None
+    opt["names"] = names
+
+    # Extract help text
+    help_match = CLICK_HELP_RE.search(dec_str)
+    if help_match:
+        opt["help"] = help_match.group(2)
+
+    # Check if it's a flag
+    if CLICK_FLAG_RE.search(dec_str):
+        opt["is_flag"] = True
+
+    # Extract choices if the type is a click.Choice
+    choice_match = CLICK_CHOICE_RE.search(dec_str)
+    if choice_match:
+        opt["choices"] = QUOTED_RE.findall(choice_match.group(1))
+
+    # MutuallyExclusiveOption(mutually_exclusive=["query"]) lists parameter names
+    exclusive_match = MUTUALLY_EXCLUSIVE_RE.search(dec_str)
+    if exclusive_match:
+        opt["mutually_exclusive"] = QUOTED_RE.findall(exclusive_match.group(1))
+
+    return opt
+
+
+def analyze_click_decorators(func) -> dict:
+    """
+    Parse a function's decorators once into a Click record shared by all consumers:
+    {"decorated": bool, "kind": "group" | "command" | None, "name": str,
+     "parent": str | None, "options": [...]}
+    """
+    record = {"decorated": False, "kind": None, "name": func.name, "parent": None, "options": []}
+    name_found = False
+
+    for dec_str in decorator_strings(func):
         if 'click' in dec_str.lower() or '.command' in dec_str or '.group' in dec_str:
-            return True
-    return False
+            record["decorated"] = True
+
+        # Decorator type: the first group/command decorator wins
+        if record["kind"] is None:
+            if '.group' in dec_str or dec_str.endswith('group()'):
+                record["kind"] = "group"
+            elif '.command' in dec_str or dec_str.endswith('command()'):
+                record["kind"] = "command"
+
+        # Look for @group.command("name") pattern
+        if not name_found:
+            match = CLICK_COMMAND_NAME_RE.search(dec_str)
+            if match:
+                record["name"] = match.group(1)
+                name_found = True
+
+        # Match @parent.command or @parent.group; @click.* has no parent group
+        if record["parent"] is None:
+            match = CLICK_PARENT_RE.search(dec_str)
+            if match and match.group(1) != "click":
+                record["parent"] = match.group(1)
+
+        # Parse @click.option
+        if 'click.option' in dec_str or '.option(' in dec_str:
+            opt = parse_click_option(dec_str)
+            if opt:
+                record["options"].append(opt)
+
+        # Parse @click.argument
+        elif 'click.argument' in dec_str or '.argument(' in dec_str:
+            name_match = CLICK_ARGUMENT_RE.search(dec_str)
+            if name_match:
+                record["options"].append({"type": "argument", "name": name_match.group(1)})
+
+    # Show mutually exclusive partners by their flag (--query) rather than parameter name (query)
+    flags = {click_param_name(opt["names"]): opt["names"][0]
+             for opt in record["options"] if opt["type"] == "option"}
+    for opt in record["options"]:
+        if opt.get("mutually_exclusive"):
+            opt["mutually_exclusive"] = [flags.get(name, name) for name in opt["mutually_exclusive"]]
+
+    return record
+
+
+def is_click_decorated(func) -> bool:
+    """Check if a griffe Function has Click decorators."""
+    return analyze_click_decorators(func)["decorated"]
 
 
 def get_click_decorator_type(func) -> str | None:
     """Get the Click decorator type: 'group', 'command', or None."""
-    if not hasattr(func, 'decorators') or not func.decorators:
-        return None
-    for dec in func.decorators:
-        dec_str = str(dec.value) if hasattr(dec, 'value') else str(dec)
-        if '.group' in dec_str or dec_str.endswith('group()'):
-            return 'group'
-        if '.command' in dec_str or dec_str.endswith('command()') or '@click.command' in dec_str:
-            return 'command'
-    return None
+    return analyze_click_decorators(func)["kind"]
 
 
 def get_click_command_name(func) -> str:
     """Extract the Click command name from decorator or function name."""
-    if hasattr(func, 'decorators') and func.decorators:
-        for dec in func.decorators:
-            dec_str = str(dec.value) if hasattr(dec, 'value') else str(dec)
-            # Look for @group.command("name") pattern
-            import re
-            match = re.search(r'\.command\(["\']([^"\']+)["\']\)', dec_str)
-            if match:
-                return match.group(1)
-    return func.name
+    return analyze_click_decorators(func)["name"]
 
 
 def get_click_parent_group(func) -> str | None:
     """Get the parent group name from decorator like @cli.command or @download.command."""
-    if not hasattr(func, 'decorators') or not func.decorators:
-        return None
-    for dec in func.decorators:
-        dec_str = str(dec.value) if hasattr(dec, 'value') else str(dec)
-        import re
-        # Match @parent.command or @parent.group
-        match = re.search(r'@?(\w+)\.(command|group)', dec_str)
-        if match:
-            return match.group(1)
-    return None
+    return analyze_click_decorators(func)["parent"]
 
 
 def extract_click_options(func) -> list[dict]:
     """Extract Click options/arguments from decorators."""
-    options = []
-    if not hasattr(func, 'decorators') or not func.decorators:
-        return options
-    
-    import re
-    
-    for dec in func.decorators:
-        dec_str = str(dec.value) if hasattr(dec, 'value') else str(dec)
-        
-        # Parse @click.option
-        if 'click.option' in dec_str or '.option(' in dec_str:
-            opt = {"type": "option"}
-            
-            # Extract option names (--name, -n)
-            names_match = re.findall(r'["\'](-{1,2}[\w-]+)["\']', dec_str)
-            if names_match:
-                opt["names"] = names_match
-            
-            # Extract help text
-            help_match = re.search(r'help\s*=\s*["\']([^"\']+)["\']', dec_str)
-            if help_match:
-                opt["help"] = help_match.group(1)
-            
-            # Check if it's a flag
-            if 'is_flag=True' in dec_str:
-                opt["is_flag"] = True
-            
-            # Extract type if specified
-            type_match = re.search(r'type\s*=\s*click\.Choice\(\[([^\]]+)\]\)', dec_str)
-            if type_match:
-                choices = re.findall(r'["\']([^"\']+)["\']', type_match.group(1))
-                opt["choices"] = choices
-            
-            if "names" in opt:
-                options.append(opt)
-        
-        # Parse @click.argument
-        elif 'click.argument' in dec_str or '.argument(' in dec_str:
-            arg = {"type": "argument"}
-            
-            # Extract argument name
-            name_match = re.search(r'argument\(["\'](\w+)["\']', dec_str, re.IGNORECASE)
-            if name_match:
-                arg["name"] = name_match.group(1)
-                options.append(arg)
-    
-    return options
+    return analyze_click_decorators(func)["options"]
 
 
 def build_click_command_tree(functions: list) -> dict:
@@ -148,21 +514,18 @@ def build_click_command_tree(functions: list) -> dict:
     commands_by_name = {}
     
     for path, func in functions:
-        if not is_click_decorated(func):
+        record = analyze_click_decorators(func)
+        if not record["decorated"]:
             continue
         
-        dec_type = get_click_decorator_type(func)
-        cmd_name = get_click_command_name(func)
-        parent = get_click_parent_group(func)
-        
         cmd_info = {
             "func": func,
             "path": path,
-            "name": cmd_name,
-            "type": dec_type,
-            "parent": parent,
+            "name": record["name"],
+            "type": record["kind"],
+            "parent": record["parent"],
             "subcommands": [],
-            "options": extract_click_options(func),
+            "options": record["options"],
         }
         
         commands_by_name[func.name] = cmd_info
@@ -179,8 +542,8 @@ def build_click_command_tree(functions: list) -> dict:
     return tree
 
 
-def format_click_command_md(cmd_info: dict, level: int = 3) -> list[str]:
-    """Format a Click command as markdown."""
+def format_click_command_md(cmd_info: dict, level: int = 3, symbols: list | None = None) -> list[str]:
+    """Format a Click command as markdown. Appends index entries to symbols if given."""
     md = []
     func = cmd_info["func"]
     cmd_name = cmd_info["name"]
@@ -192,6 +555,7 @@ def format_click_command_md(cmd_info: dict, level: int = 3) -> list[str]:
     prefix = "#" * level
     type_label = "Command Group" if cmd_type == "group" else "Command"
     
+    heading_line = len(md)
     if cmd_type == "group":
         md.append(f"{prefix} `{cmd_name}` {type_label}\n")
     else:
@@ -206,14 +570,20 @@ def format_click_command_md(cmd_info: dict, level: int = 3) -> list[str]:
     
     # Usage
     if cmd_type == "group":
-        md.append(f"```bash\nhoodini {cmd_name} <command> [options]\n```\n")
+        usage = f"hoodini {cmd_name} <command> [options]"
+        md.append(f"```bash\n{usage}\n```\n")
     else:
         # Build usage from parent chain
         parent = cmd_info.get("parent")
         if parent and parent != "cli":
-            md.append(f"```bash\nhoodini {parent} {cmd_name} [options]\n```\n")
-        elif parent == "cli" or not parent:
-            md.append(f"```bash\nhoodini {cmd_name} [options]\n```\n")
+            usage = f"hoodini {parent} {cmd_name} [options]"
+        else:
+            usage = f"hoodini {cmd_name} [options]"
+        md.append(f"```bash\n{usage}\n```\n")
+    
+    command_path = usage.replace(" <command>", "").replace(" [options]", "")
+    add_symbol(symbols, heading_line, command_path, cmd_type or "command",
+               signature=usage, summary=first_line(format_docstring(func)))
     
     # Options table
     if options:
@@ -228,9 +598,17 @@ def format_click_command_md(cmd_info: dict, level: int = 3) -> list[str]:
                     help_text = f"(flag) {help_text}"
                 if opt.get("choices"):
                     help_text += f" Choices: {', '.join(opt['choices'])}"
+                if opt.get("mutually_exclusive"):
+                    others = ", ".join(f"`{n}`" for n in opt["mutually_exclusive"])
+                    help_text += f" Mutually exclusive with: {others}"
                 md.append(f"| {names} | {help_text} |")
+                fields = {key: opt[key] for key in ("is_flag", "choices", "mutually_exclusive") if opt.get(key)}
+                add_symbol(symbols, heading_line, f"{command_path} {opt['names'][0]}", "option",
+                           signature=", ".join(opt["names"]), summary=opt.get("help", ""), **fields)
             elif opt["type"] == "argument":
                 md.append(f"| `{opt.get('name', 'ARG')}` | (positional argument) |")
+                add_symbol(symbols, heading_line, f"{command_path} {opt.get('name', 'ARG')}", "argument",
+                           signature=opt.get("name", "ARG").upper())
         md.append("")
     
     # Subcommands
@@ -246,42 +624,35 @@ def format_click_command_md(cmd_info: dict, level: int = 3) -> list[str]:
         
         # Render subcommands
         for subcmd in sorted(subcommands, key=lambda x: x["name"]):
-            md.extend(format_click_command_md(subcmd, level + 1))
+            sub_symbols = [] if symbols is not None else None
+            extend_md(md, format_click_command_md(subcmd, level + 1, symbols=sub_symbols),
+                      symbols, sub_symbols)
     
     return md
 
 def get_category_for_module(package_name: str, module_path: str) -> tuple[str, str] | None:
     """
     Determine category for a module based on its path prefix.
-    
+
     Returns (category_name, description) or None if uncategorized.
     """
     folder_map = FOLDER_CATEGORY_MAP.get(package_name, {})
-    
+
     # Check each folder prefix (more specific first if needed)
     for prefix, (cat_name, cat_desc) in folder_map.items():
         # Module path starts with the prefix (exact match or submodule)
         if module_path == prefix or module_path.startswith(f"{prefix}."):
             return (cat_name, cat_desc)
-    
+
     return None
 
 
-def generate_python_api(package_name: str, search_paths: list[str], output_path: str):
-    """Generate API reference markdown for Python package using griffe."""
-    from griffe import load, Module, Class, Function, Attribute
-    
-    print(f"Loading Python package {package_name}...")
-    module = load(package_name, search_paths=search_paths)
-    
-    md = []
-    
-    # Package-specific titles and descriptions
-    package_info = {
-        "hoodini": {
-            "title": "Hoodini API Reference",
-            "description": "Python API for gene neighborhood analysis at scale.",
-            "intro": """
+# Package-specific titles and descriptions
+PACKAGE_INFO = {
+    "hoodini": {
+        "title": "Hoodini API Reference",
+        "description": "Python API for gene neighborhood analysis at scale.",
+        "intro": """
 Hoodini is a comprehensive tool for gene-centric comparative genomics using publicly available data.
 This reference documents the Python API for programmatic access to Hoodini's functionality.
 
@@ -290,11 +661,11 @@ This reference documents the Python API for programmatic access to Hoodini's fun
 - [Quick Start](/docs/hoodini/quickstart) - Getting started guide
 - [Outputs](/docs/hoodini/outputs) - Output file formats
 """,
-        },
-        "hoodini_colab": {
-            "title": "Hoodini Colab API Reference",
-            "description": "Python API for running Hoodini in Google Colab notebooks.",
-            "intro": """
+    },
+    "hoodini_colab": {
+        "title": "Hoodini Colab API Reference",
+        "description": "Python API for running Hoodini in Google Colab notebooks.",
+        "intro": """
 Hoodini Colab provides an interactive widget interface for running Hoodini analysis directly in Google Colab.
 It handles installation, parameter configuration, and execution in a user-friendly way.
 
@@ -305,424 +676,677 @@ launcher = create_launcher()
 display(launcher)
 ```
 """,
-        },
-    }
-    
-    info = package_info.get(package_name, {
-        "title": f"{package_name.replace('_', ' ').title()} API Reference",
-        "description": f"API documentation for `{package_name}`.",
-        "intro": "",
-    })
-    
-    md.append(f"# {info['title']}\n")
-    md.append(f"{info['description']}\n")
-    
-    # Collect version
-    for name, obj in module.members.items():
-        if isinstance(obj, Attribute) and name == "__version__":
-            md.append(f"**Version:** `{obj.value}`\n")
-            break
-    
-    if info.get("intro"):
-        md.append(info["intro"])
-    
-    def format_signature(func, include_self=False):
-        params = []
-        for param in func.parameters:
-            if param.name == "self" and not include_self:
-                continue
-            param_str = param.name
-            if param.annotation:
-                ann = str(param.annotation)
-                ann = ann.replace("<", "\\<").replace(">", "\\>")
-                param_str += f": {ann}"
-            if param.default:
-                default_str = str(param.default)
-                # Clean up common defaults
-                if default_str == "None":
-                    param_str += " = None"
-                elif default_str == "{}":
-                    param_str += " = \\{\\}"
-                else:
-                    param_str += f" = {default_str}"
-            params.append(param_str)
-        sig = f"def {func.name}({', '.join(params)})"
-        if func.returns:
-            ret = str(func.returns).replace("<", "\\<").replace(">", "\\>")
-            sig += f" -> {ret}"
-        return sig
-    
-    def format_docstring(obj):
-        if not obj.docstring:
-            return ""
-        return obj.docstring.value
-    
-    def parse_docstring_sections(docstring: str) -> dict:
-        """Parse docstring into sections (Args, Returns, etc.)."""
-        sections = {"description": "", "args": [], "returns": "", "raises": [], "examples": ""}
-        if not docstring:
-            return sections
-        
-        lines = docstring.strip().split("\n")
-        current_section = "description"
-        current_content = []
-        
-        section_headers = {
-            "args:": "args", "arguments:": "args", "parameters:": "args", "params:": "args",
-            "returns:": "returns", "return:": "returns",
-            "raises:": "raises", "raise:": "raises", "exceptions:": "raises",
-            "example:": "examples", "examples:": "examples",
-            "yields:": "yields", "yield:": "yields",
-            "note:": "note", "notes:": "note",
-        }
-        
-        for line in lines:
-            lower = line.strip().lower()
-            if lower in section_headers:
-                # Save current section
-                if current_section == "description":
-                    sections["description"] = "\n".join(current_content).strip()
-                current_section = section_headers[lower]
-                current_content = []
+    },
+}
+
+
+def format_signature(func, include_self=False):
+    params = []
+    for param in func.parameters:
+        if param.name == "self" and not include_self:
+            continue
+        param_str = param.name
+        if param.annotation:
+            ann = str(param.annotation)
+            ann = ann.replace("<", "\\<").replace(">", "\\>")
+            param_str += f": {ann}"
+        if param.default:
+            default_str = str(param.default)
+            # Clean up common defaults
+            if default_str == "None":
+                param_str += " = None"
+            elif default_str == "{}":
+                param_str += " = \\{\\}"
             else:
-                current_content.append(line)
-        
-        # Save last section
-        if current_section == "description":
-            sections["description"] = "\n".join(current_content).strip()
-        elif current_section == "returns":
-            sections["returns"] = "\n".join(current_content).strip()
-        elif current_section == "examples":
-            sections["examples"] = "\n".join(current_content).strip()
-        
+                param_str += f" = {default_str}"
+        params.append(param_str)
+    sig = f"def {func.name}({', '.join(params)})"
+    if func.returns:
+        ret = str(func.returns).replace("<", "\\<").replace(">", "\\>")
+        sig += f" -> {ret}"
+    return sig
+
+
+def format_docstring(obj):
+    if not obj.docstring:
+        return ""
+    return obj.docstring.value
+
+
+def parse_docstring_sections(docstring: str) -> dict:
+    """Parse docstring into sections (Args, Returns, etc.)."""
+    sections = {"description": "", "args": [], "returns": "", "raises": [], "examples": ""}
+    if not docstring:
         return sections
-    
-    def format_docstring_rich(obj):
-        """Format docstring with proper markdown sections.
-        
-        Converts docstring sections to styled text (not headers) to avoid TOC pollution.
-        Also removes underline-style headers (lines of dashes/equals) that would create H1/H2.
-        """
-        if not obj.docstring:
-            return ""
-        
-        doc = obj.docstring.value.strip()
-        
-        # Get first paragraph as description
-        parts = doc.split("\n\n", 1)
-        description = parts[0].strip()
-        
-        # If there's more content, process it to avoid TOC headers
-        if len(parts) > 1:
-            rest = parts[1]
-            
-            import re
-            
-            # First, remove Setext-style header underlines (lines of dashes or equals)
-            # These create H1/H2 headers in markdown when following any text
-            processed_rest = re.sub(r'\n[-=]{3,}\n', '\n', rest)
-            # Also handle case where underline is at end of text block
-            processed_rest = re.sub(r'\n[-=]{3,}$', '', processed_rest)
-            
-            # Convert section headers to styled text (not markdown headers)
-            # These patterns in docstrings should not become TOC entries
-            section_patterns = [
-                "Expected Files:", "Generated Files:", "Process:", 
-                "Parameters:", "Returns:", "Args:", "Arguments:",
-                "Raises:", "Yields:", "Example:", "Examples:",
-                "Note:", "Notes:", "Warning:", "Warnings:",
-                "See Also:", "References:", "Attributes:",
-            ]
-            
-            for pattern in section_patterns:
-                # Replace standalone section headers with bold text
-                # Match the pattern when it's on its own line or starts a section
-                processed_rest = re.sub(
-                    rf'^({re.escape(pattern)})',
-                    r'**\1**',
-                    processed_rest,
-                    flags=re.MULTILINE
-                )
-            
-            return f"{description}\n\n{processed_rest}"
-        
-        return description
-    
-    # Collect ALL items recursively
+
+    lines = docstring.strip().split("\n")
+    current_section = "description"
+    current_content = []
+
+    section_headers = {
+        "args:": "args", "arguments:": "args", "parameters:": "args", "params:": "args",
+        "returns:": "returns", "return:": "returns",
+        "raises:": "raises", "raise:": "raises", "exceptions:": "raises",
+        "example:": "examples", "examples:": "examples",
+        "yields:": "yields", "yield:": "yields",
+        "note:": "note", "notes:": "note",
+    }
+
+    for line in lines:
+        lower = line.strip().lower()
+        if lower in section_headers:
+            # Save current section
+            if current_section == "description":
+                sections["description"] = "\n".join(current_content).strip()
+            current_section = section_headers[lower]
+            current_content = []
+        else:
+            current_content.append(line)
+
+    # Save last section
+    if current_section == "description":
+        sections["description"] = "\n".join(current_content).strip()
+    elif current_section == "returns":
+        sections["returns"] = "\n".join(current_content).strip()
+    elif current_section == "examples":
+        sections["examples"] = "\n".join(current_content).strip()
+
+    return sections
+
+
+def format_docstring_rich(obj):
+    """Format docstring with proper markdown sections.
+
+    Converts docstring sections to styled text (not headers) to avoid TOC pollution.
+    Also removes underline-style headers (lines of dashes/equals) that would create H1/H2.
+    """
+    if not obj.docstring:
+        return ""
+
+    doc = obj.docstring.value.strip()
+
+    # Get first paragraph as description
+    parts = doc.split("\n\n", 1)
+    description = parts[0].strip()
+
+    # If there's more content, process it to avoid TOC headers
+    if len(parts) > 1:
+        rest = parts[1]
+
+        # First, remove Setext-style header underlines (lines of dashes or equals)
+        # These create H1/H2 headers in markdown when following any text
+        processed_rest = re.sub(r'\n[-=]{3,}\n', '\n', rest)
+        # Also handle case where underline is at end of text block
+        processed_rest = re.sub(r'\n[-=]{3,}$', '', processed_rest)
+
+        # Convert section headers to styled text (not markdown headers)
+        # These patterns in docstrings should not become TOC entries
+        section_patterns = [
+            "Expected Files:", "Generated Files:", "Process:",
+            "Parameters:", "Returns:", "Args:", "Arguments:",
+            "Raises:", "Yields:", "Example:", "Examples:",
+            "Note:", "Notes:", "Warning:", "Warnings:",
+            "See Also:", "References:", "Attributes:",
+        ]
+
+        for pattern in section_patterns:
+            # Replace standalone section headers with bold text
+            # Match the pattern when it's on its own line or starts a section
+            processed_rest = re.sub(
+                rf'^({re.escape(pattern)})',
+                r'**\1**',
+                processed_rest,
+                flags=re.MULTILINE
+            )
+
+        return f"{description}\n\n{processed_rest}"
+
+    return description
+
+
+def collect_python_modules(module, package_name: str) -> dict:
+    """
+    Collect ALL items recursively from a griffe module.
+    Returns: {display_path: {"module": mod, "doc": doc, "classes": [...], "functions": [...]}}
+    """
+    from griffe import Module, Class, Function
+
     all_modules = []  # (path, module, doc)
     all_classes = []  # (path, class)
     all_functions = []  # (path, function)
-    
+
     def collect_from_module(mod, path=""):
         current_path = f"{path}.{mod.name}" if path else mod.name
         display_path = current_path.replace(f"{package_name}.", "")
         if display_path == package_name:
             display_path = ""
-        
+
         doc = format_docstring(mod)
         if display_path:
             all_modules.append((display_path, mod, doc))
-        
+
         for name, obj in mod.members.items():
             if name.startswith("_"):
                 continue
-            
+
             if isinstance(obj, Module):
                 collect_from_module(obj, current_path)
             elif isinstance(obj, Class):
                 all_classes.append((display_path, obj))
             elif isinstance(obj, Function):
                 all_functions.append((display_path, obj))
-    
+
     collect_from_module(module)
-    
+
     # Group by module path
     modules_by_path = {}
     for path, mod, doc in all_modules:
         modules_by_path[path] = {"module": mod, "doc": doc, "classes": [], "functions": []}
-    
+
     modules_by_path[""] = {"module": None, "doc": "", "classes": [], "functions": []}
-    
+
     for path, cls in all_classes:
         if path not in modules_by_path:
             modules_by_path[path] = {"module": None, "doc": "", "classes": [], "functions": []}
         modules_by_path[path]["classes"].append(cls)
-    
+
     for path, func in all_functions:
         if path not in modules_by_path:
             modules_by_path[path] = {"module": None, "doc": "", "classes": [], "functions": []}
         modules_by_path[path]["functions"].append(func)
-    
-    # Get folder-based category mapping for this package
-    folder_map = FOLDER_CATEGORY_MAP.get(package_name, {})
-    
-    if folder_map:
-        # Auto-categorize modules based on their path prefix
-        # Group modules by their detected category
-        categories_found = {}  # {(cat_name, cat_desc): [module_paths]}
-        uncategorized = []
-        
-        for path in modules_by_path.keys():
-            if not path:  # Skip root module
-                continue
-            
-            cat_info = get_category_for_module(package_name, path)
-            if cat_info:
-                if cat_info not in categories_found:
-                    categories_found[cat_info] = []
-                categories_found[cat_info].append(path)
-            else:
-                uncategorized.append(path)
-        
-        # Define category order for consistent output
-        category_order = list(folder_map.values())
-        
-        # Output categorized modules in defined order
-        for cat_name, cat_desc in category_order:
-            cat_key = (cat_name, cat_desc)
-            if cat_key not in categories_found:
-                continue
-            
-            matching_paths = categories_found[cat_key]
-            
-            # Category header
-            md.append("---\n")
-            md.append(f"## {cat_name}\n")
-            if cat_desc:
-                md.append(f"{cat_desc}\n")
-            
-            # Special handling for CLI Commands - parse Click decorators
-            if cat_name == "CLI Commands":
-                # Collect all functions from CLI modules
-                cli_functions = []
-                for path in matching_paths:
-                    info = modules_by_path[path]
-                    for func in info["functions"]:
-                        cli_functions.append((path, func))
-                
-                # Build Click command tree
-                click_tree = build_click_command_tree(cli_functions)
-                
-                if click_tree:
-                    # Render Click commands with proper hierarchy
-                    for cmd_name in sorted(click_tree.keys()):
-                        cmd_info = click_tree[cmd_name]
-                        md.extend(format_click_command_md(cmd_info, level=3))
-                else:
-                    # Fallback to standard function rendering if no Click commands found
-                    for path in sorted(matching_paths):
-                        info = modules_by_path[path]
-                        for func in info["functions"]:
-                            md.append(f"### `{func.name}()`\n")
-                            md.append("```python")
-                            md.append(format_signature(func))
-                            md.append("```\n")
-                            func_doc = format_docstring_rich(func)
-                            if func_doc:
-                                md.append(f"{func_doc}\n")
-                continue
-            
-            # Standard rendering for non-CLI categories
-            # Output modules in this category
+
+    return modules_by_path
+
+
+def group_modules_by_category(package_name: str, modules_by_path: dict) -> tuple[dict, list]:
+    """
+    Auto-categorize modules based on their path prefix.
+    Returns ({(cat_name, cat_desc): [module_paths]}, [uncategorized_paths]).
+    """
+    categories_found = {}
+    uncategorized = []
+
+    for path in modules_by_path.keys():
+        if not path:  # Skip root module
+            continue
+
+        cat_info = get_category_for_module(package_name, path)
+        if cat_info:
+            if cat_info not in categories_found:
+                categories_found[cat_info] = []
+            categories_found[cat_info].append(path)
+        else:
+            uncategorized.append(path)
+
+    return categories_found, uncategorized
+
+
+def format_python_header_md(package_name: str, module) -> list[str]:
+    """Format the page title, version and intro for a Python package."""
+    from griffe import Attribute
+
+    md = []
+    info = PACKAGE_INFO.get(package_name, {
+        "title": f"{package_name.replace('_', ' ').title()} API Reference",
+        "description": f"API documentation for `{package_name}`.",
+        "intro": "",
+    })
+
+    md.append(f"# {info['title']}\n")
+    md.append(f"{info['description']}\n")
+
+    # Collect version
+    for name, obj in module.members.items():
+        if isinstance(obj, Attribute) and name == "__version__":
+            md.append(f"**Version:** `{obj.value}`\n")
+            break
+
+    if info.get("intro"):
+        md.append(info["intro"])
+
+    return md
+
+
+def format_python_module_md(path: str, info: dict, method_docs: bool = True,
+                            symbols: list | None = None) -> list[str]:
+    """Format one module (classes, methods, functions) as markdown. Appends index entries to symbols if given."""
+    from griffe import Function
+
+    md = []
+    classes = info["classes"]
+    functions = info["functions"]
+    module_doc = info["doc"]
+
+    if not classes and not functions and not module_doc:
+        return md
+
+    # Module sub-header
+    if info["module"] is not None:
+        add_symbol(symbols, len(md), info["module"].path, "module", summary=first_line(module_doc))
+    md.append(f"### `{path}`\n")
+    if module_doc:
+        md.append(f"{module_doc}\n")
+
+    # Classes
+    for cls in classes:
+        cls_doc = format_docstring_rich(cls)
+        cls_line = len(md)
+        add_symbol(symbols, cls_line, cls.path, "class", signature=f"class {cls.name}",
+                   summary=first_line(cls_doc))
+        md.append(f"#### `{cls.name}`\n")
+        if cls_doc:
+            md.append(f"{cls_doc}\n")
+
+        # Methods
+        methods = [m for m in cls.members.values()
+                  if isinstance(m, Function) and not m.name.startswith("_")]
+        if methods:
+            md.append("**Methods:**\n")
+            for method in methods:
+                add_symbol(symbols, cls_line, method.path, "method", signature=format_signature(method),
+                           summary=first_line(format_docstring(method)))
+                md.append(f"- `{method.name}()`\n")
+                md.append("  ```python")
+                md.append(f"  {format_signature(method)}")
+                md.append("  ```\n")
+                if not method_docs:
+                    continue
+                method_doc = format_docstring_rich(method)
+                if method_doc:
+                    # First line only for brevity
+                    summary_line = method_doc.split("\n")[0]
+                    md.append(f"  {summary_line}\n")
+
+    # Functions
+    for func in functions:
+        add_symbol(symbols, len(md), func.path, "function", signature=format_signature(func),
+                   summary=first_line(format_docstring(func)))
+        md.append(f"#### `{func.name}()`\n")
+        md.append("```python")
+        md.append(format_signature(func))
+        md.append("```\n")
+
+        func_doc = format_docstring_rich(func)
+        if func_doc:
+            md.append(f"{func_doc}\n")
+
+    return md
+
+
+def format_python_category_md(cat_name: str, cat_desc: str, matching_paths: list[str],
+                              modules_by_path: dict, symbols: list | None = None) -> list[str]:
+    """Format one FOLDER_CATEGORY_MAP category (header plus its modules) as markdown."""
+    md = []
+
+    # Category header
+    md.append("---\n")
+    md.append(f"## {cat_name}\n")
+    if cat_desc:
+        md.append(f"{cat_desc}\n")
+
+    # Special handling for CLI Commands - parse Click decorators
+    if cat_name == "CLI Commands":
+        # Collect all functions from CLI modules
+        cli_functions = []
+        for path in matching_paths:
+            info = modules_by_path[path]
+            for func in info["functions"]:
+                cli_functions.append((path, func))
+
+        # Build Click command tree
+        click_tree = build_click_command_tree(cli_functions)
+
+        if click_tree:
+            # Render Click commands with proper hierarchy
+            for cmd_name in sorted(click_tree.keys()):
+                cmd_info = click_tree[cmd_name]
+                cmd_symbols = [] if symbols is not None else None
+                extend_md(md, format_click_command_md(cmd_info, level=3, symbols=cmd_symbols),
+                          symbols, cmd_symbols)
+        else:
+            # Fallback to standard function rendering if no Click commands found
             for path in sorted(matching_paths):
                 info = modules_by_path[path]
-                classes = info["classes"]
-                functions = info["functions"]
-                module_doc = info["doc"]
-                
-                if not classes and not functions and not module_doc:
-                    continue
-                
-                # Module sub-header
-                md.append(f"### `{path}`\n")
-                if module_doc:
-                    md.append(f"{module_doc}\n")
-                
-                # Classes
-                for cls in classes:
-                    cls_doc = format_docstring_rich(cls)
-                    md.append(f"#### `{cls.name}`\n")
-                    if cls_doc:
-                        md.append(f"{cls_doc}\n")
-                    
-                    # Methods
-                    methods = [m for m in cls.members.values() 
-                              if isinstance(m, Function) and not m.name.startswith("_")]
-                    if methods:
-                        md.append("**Methods:**\n")
-                        for method in methods:
-                            md.append(f"- `{method.name}()`\n")
-                            md.append("  ```python")
-                            md.append(f"  {format_signature(method)}")
-                            md.append("  ```\n")
-                            method_doc = format_docstring_rich(method)
-                            if method_doc:
-                                # First line only for brevity
-                                first_line = method_doc.split("\n")[0]
-                                md.append(f"  {first_line}\n")
-                
-                # Functions
-                for func in functions:
-                    md.append(f"#### `{func.name}()`\n")
+                for func in info["functions"]:
+                    add_symbol(symbols, len(md), func.path, "function", signature=format_signature(func),
+                               summary=first_line(format_docstring(func)))
+                    md.append(f"### `{func.name}()`\n")
                     md.append("```python")
                     md.append(format_signature(func))
                     md.append("```\n")
-                    
                     func_doc = format_docstring_rich(func)
                     if func_doc:
                         md.append(f"{func_doc}\n")
-        
-        # Handle uncategorized modules (modules not matching any folder prefix)
-        if uncategorized:
+        return md
+
+    # Standard rendering for non-CLI categories
+    for path in sorted(matching_paths):
+        module_symbols = [] if symbols is not None else None
+        extend_md(md, format_python_module_md(path, modules_by_path[path], symbols=module_symbols),
+                  symbols, module_symbols)
+
+    return md
+
+
+def format_python_uncategorized_md(uncategorized: list[str], modules_by_path: dict,
+                                   symbols: list | None = None) -> list[str]:
+    """Format modules not matching any folder prefix as an "Other Modules" section."""
+    md = []
+    md.append("---\n")
+    md.append("## Other Modules\n")
+
+    for path in sorted(uncategorized):
+        module_symbols = [] if symbols is not None else None
+        extend_md(md, format_python_module_md(path, modules_by_path[path], method_docs=False,
+                                              symbols=module_symbols),
+                  symbols, module_symbols)
+
+    return md
+
+
+def format_python_flat_md(modules_by_path: dict, symbols: list | None = None) -> list[str]:
+    """Fallback: original flat organization for packages without a category map."""
+    from griffe import Function
+
+    md = []
+    sorted_paths = sorted(modules_by_path.keys(), key=lambda x: (x == "", x))
+
+    for path in sorted_paths:
+        info = modules_by_path[path]
+        classes = info["classes"]
+        functions = info["functions"]
+        module_doc = info["doc"]
+
+        if not classes and not functions and not module_doc:
+            continue
+
+        if path:
             md.append("---\n")
-            md.append("## Other Modules\n")
-            
-            for path in sorted(uncategorized):
-                info = modules_by_path[path]
-                classes = info["classes"]
-                functions = info["functions"]
-                module_doc = info["doc"]
-                
-                if not classes and not functions and not module_doc:
-                    continue
-                
-                md.append(f"### `{path}`\n")
-                if module_doc:
-                    md.append(f"{module_doc}\n")
-                
-                for cls in classes:
-                    cls_doc = format_docstring_rich(cls)
-                    md.append(f"#### `{cls.name}`\n")
-                    if cls_doc:
-                        md.append(f"{cls_doc}\n")
-                    
-                    methods = [m for m in cls.members.values() 
-                              if isinstance(m, Function) and not m.name.startswith("_")]
-                    if methods:
-                        md.append("**Methods:**\n")
-                        for method in methods:
-                            md.append(f"- `{method.name}()`\n")
-                            md.append("  ```python")
-                            md.append(f"  {format_signature(method)}")
-                            md.append("  ```\n")
-                
-                for func in functions:
-                    md.append(f"#### `{func.name}()`\n")
-                    md.append("```python")
-                    md.append(format_signature(func))
-                    md.append("```\n")
-                    func_doc = format_docstring_rich(func)
-                    if func_doc:
-                        md.append(f"{func_doc}\n")
-    
-    else:
-        # Fallback: original flat organization
-        sorted_paths = sorted(modules_by_path.keys(), key=lambda x: (x == "", x))
-        
-        for path in sorted_paths:
-            info = modules_by_path[path]
-            classes = info["classes"]
-            functions = info["functions"]
-            module_doc = info["doc"]
-            
-            if not classes and not functions and not module_doc:
-                continue
-            
+            if info["module"] is not None:
+                add_symbol(symbols, len(md), info["module"].path, "module", summary=first_line(module_doc))
+            md.append(f"## Module: `{path}`\n")
+            if module_doc:
+                md.append(f"{module_doc}\n")
+
+        if classes:
             if path:
-                md.append("---\n")
-                md.append(f"## Module: `{path}`\n")
-                if module_doc:
-                    md.append(f"{module_doc}\n")
-            
-            if classes:
+                md.append("### Classes\n")
+            else:
+                md.append("## Classes\n")
+
+            for cls in classes:
+                cls_doc = format_docstring_rich(cls)
+                cls_line = len(md)
+                add_symbol(symbols, cls_line, cls.path, "class", signature=f"class {cls.name}",
+                           summary=first_line(cls_doc))
                 if path:
-                    md.append("### Classes\n")
+                    md.append(f"#### `{cls.name}`\n")
                 else:
-                    md.append("## Classes\n")
-                
-                for cls in classes:
-                    cls_doc = format_docstring_rich(cls)
-                    if path:
-                        md.append(f"#### `{cls.name}`\n")
-                    else:
-                        md.append(f"### `{cls.name}`\n")
-                    
-                    if cls_doc:
-                        md.append(f"{cls_doc}\n")
-                    
-                    methods = [m for m in cls.members.values() 
-                              if isinstance(m, Function) and not m.name.startswith("_")]
-                    if methods:
-                        md.append("**Methods:**\n")
-                        for method in methods:
-                            md.append(f"- `{method.name}()`\n")
-                            md.append("  ```python")
-                            md.append(f"  {format_signature(method)}")
-                            md.append("  ```\n")
-            
-            if functions:
+                    md.append(f"### `{cls.name}`\n")
+
+                if cls_doc:
+                    md.append(f"{cls_doc}\n")
+
+                methods = [m for m in cls.members.values()
+                          if isinstance(m, Function) and not m.name.startswith("_")]
+                if methods:
+                    md.append("**Methods:**\n")
+                    for method in methods:
+                        add_symbol(symbols, cls_line, method.path, "method",
+                                   signature=format_signature(method),
+                                   summary=first_line(format_docstring(method)))
+                        md.append(f"- `{method.name}()`\n")
+                        md.append("  ```python")
+                        md.append(f"  {format_signature(method)}")
+                        md.append("  ```\n")
+
+        if functions:
+            if path:
+                md.append("### Functions\n")
+            else:
+                md.append("## Functions\n")
+
+            for func in functions:
+                add_symbol(symbols, len(md), func.path, "function", signature=format_signature(func),
+                           summary=first_line(format_docstring(func)))
                 if path:
-                    md.append("### Functions\n")
+                    md.append(f"#### `{func.name}()`\n")
                 else:
-                    md.append("## Functions\n")
-                
-                for func in functions:
-                    if path:
-                        md.append(f"#### `{func.name}()`\n")
-                    else:
-                        md.append(f"### `{func.name}()`\n")
-                    
-                    md.append("```python")
-                    md.append(format_signature(func))
-                    md.append("```\n")
-                    
-                    func_doc = format_docstring_rich(func)
-                    if func_doc:
-                        md.append(f"{func_doc}\n")
-    
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    Path(output_path).write_text("\n".join(md))
-    print(f"Generated {output_path}")
+                    md.append(f"### `{func.name}()`\n")
+
+                md.append("```python")
+                md.append(format_signature(func))
+                md.append("```\n")
+
+                func_doc = format_docstring_rich(func)
+                if func_doc:
+                    md.append(f"{func_doc}\n")
+
+    return md
+
+
+# ============ RENDER CACHE ============
+
+# Bump when the cache layout changes; edits to this script invalidate fragments on their own.
+CACHE_VERSION = 3
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "api-docs"
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    return hash_bytes(Path(path).read_bytes())
+
+
+def hash_source_tree(root: Path, pattern: str = "*.py") -> dict[str, str]:
+    """Hash every file matching pattern under root. Returns {relative_posix_path: sha256}."""
+    root = Path(root)
+    if root.is_file():
+        return {root.name: hash_file(root)}
+    return {
+        p.relative_to(root).as_posix(): hash_file(p)
+        for p in sorted(root.rglob(pattern))
+        if p.is_file() and "__pycache__" not in p.parts
+    }
+
+
+def find_package_dir(package_name: str, search_paths: list[str]) -> Path | None:
+    """Locate the source directory (or single-file module) griffe will load for a package."""
+    for search_path in search_paths:
+        candidate = Path(search_path) / package_name
+        if candidate.is_dir():
+            return candidate.resolve()
+        if candidate.with_suffix(".py").is_file():
+            return candidate.with_suffix(".py").resolve()
+    return None
+
+
+def load_render_cache(cache_path: Path) -> dict:
+    """Load a render cache file, returning an empty cache if missing, stale or corrupt."""
+    try:
+        cache = json.loads(Path(cache_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache
+
+
+def save_render_cache(cache_path: Path, cache: dict):
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(cache))
+    tmp_path.replace(cache_path)
+
+
+def module_source_hashes(paths: list[str], modules_by_path: dict, package_dir: Path,
+                         source_hashes: dict[str, str]) -> list[tuple[str, str]]:
+    """Map module display paths to the hashes of their source files."""
+    pairs = []
+    for path in sorted(paths):
+        mod = modules_by_path[path]["module"]
+        filepath = getattr(mod, "filepath", None) if mod is not None else None
+        if isinstance(filepath, list):
+            # Namespace packages have several directories and no source file of their own
+            filepath = None
+        file_hash = ""
+        if filepath is not None:
+            try:
+                rel = Path(filepath).resolve().relative_to(package_dir).as_posix()
+                file_hash = source_hashes.get(rel, "")
+            except ValueError:
+                file_hash = ""
+        pairs.append((path, file_hash))
+    return pairs
+
+
+def fragment_key(generator_hash: str, title: tuple[str, str], sources: list[tuple[str, str]]) -> str:
+    payload = json.dumps([generator_hash, list(title), sources])
+    return hash_bytes(payload.encode())
+
+
+def load_fragment(fragment_dir: Path, key: str) -> tuple[list[str], list[dict]] | None:
+    """Rendered (lines, symbols) of a cached fragment, or None if it is missing or corrupt."""
+    try:
+        fragment = json.loads((fragment_dir / f"{key}.json").read_text())
+        return fragment["lines"], fragment["symbols"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def prune_fragments(fragment_dir: Path, keep: set[str]):
+    """Delete cached fragments no longer referenced by the render cache."""
+    for path in fragment_dir.glob("*.json"):
+        if path.stem not in keep:
+            path.unlink(missing_ok=True)
+
+
+def generate_python_api(package_name: str, search_paths: list[str], output_path: str,
+                        cache_dir: str | Path | None = DEFAULT_CACHE_DIR, split: bool = False,
+                        module=None, loaded_sources: dict[str, str] | None = None):
+    """
+    Generate API reference markdown for Python package using griffe.
+
+    Rendered category fragments are cached in cache_dir keyed by the source hashes of
+    their modules, so only categories whose modules changed are re-rendered. When no
+    source file changed at all, griffe is not even loaded. Pass cache_dir=None to disable.
+
+    Each category is streamed to disk as soon as it is rendered (see ReferenceOutput),
+    so memory stays flat however large the package is. A symbol index (see
+    write_symbol_index) is written next to the markdown output. With split=True,
+    output_path is a directory of per-category pages.
+
+    If module is given (an already loaded griffe package, see watch_python_api) it is
+    rendered instead of loading the package again. loaded_sources then holds the hashes
+    of the files it was built from (as returned by hash_source_tree), so that fragments
+    are keyed by what is rendered rather than by files on disk it could not parse.
+    """
+    output_path = Path(output_path)
+    generator_hash = hash_file(Path(__file__))
+    package_dir = find_package_dir(package_name, search_paths)
+
+    cache = {}
+    cache_path = None
+    fragment_dir = None
+    source_hashes = {}
+    if cache_dir is not None and package_dir is not None:
+        cache_path = Path(cache_dir) / f"{package_name}.json"
+        fragment_dir = Path(cache_dir) / package_name
+        cache = load_render_cache(cache_path)
+        source_hashes = loaded_sources if loaded_sources is not None else hash_source_tree(package_dir)
+
+        # Fast path: nothing changed since the last run and the outputs are untouched
+        outputs = cache.get("outputs", {})
+        if (cache.get("generator") == generator_hash
+                and cache.get("sources") == source_hashes
+                and cache.get("output") == str(output_path.resolve())
+                and cache.get("split") == split
+                and outputs
+                and all(Path(p).is_file() and hash_file(p) == h for p, h in outputs.items())):
+            print(f"{package_name}: sources unchanged, {output_path} is up to date")
+            return
+
+    if module is None:
+        from griffe import load
+
+        print(f"Loading Python package {package_name}...")
+        module = load(package_name, search_paths=search_paths)
+
+    modules_by_path = collect_python_modules(module, package_name)
+
+    # Get folder-based category mapping for this package
+    folder_map = FOLDER_CATEGORY_MAP.get(package_name, {})
+
+    old_fragments = cache.get("fragments", {})
+    fragments = {}
+    rebuilt = []
+
+    def cached_fragment(title, paths, render):
+        """
+        Return (lines, symbols) for a section, reusing the cached render if its
+        modules are unchanged. render(symbols) renders it from scratch.
+        """
+        if cache_path is None:
+            fragment_symbols = []
+            return render(fragment_symbols), fragment_symbols
+        key = fragment_key(generator_hash, title, module_source_hashes(
+            paths, modules_by_path, package_dir, source_hashes))
+        fragments[title[0]] = {"key": key}
+        entry = old_fragments.get(title[0])
+        cached = load_fragment(fragment_dir, key) if entry and entry.get("key") == key else None
+        if cached is not None:
+            return cached
+        fragment_symbols = []
+        lines = render(fragment_symbols)
+        rebuilt.append(title[0])
+        save_render_cache(fragment_dir / f"{key}.json", {"lines": lines, "symbols": fragment_symbols})
+        return lines, fragment_symbols
+
+    with ReferenceOutput(output_path, package_name, split=split) as out:
+        out.write(format_python_header_md(package_name, module))
+
+        if folder_map:
+            categories_found, uncategorized = group_modules_by_category(package_name, modules_by_path)
+
+            # Output categorized modules in defined order
+            for cat_name, cat_desc in folder_map.values():
+                cat_key = (cat_name, cat_desc)
+                if cat_key not in categories_found:
+                    continue
+                matching_paths = categories_found[cat_key]
+                out.write(*cached_fragment(
+                    cat_key, matching_paths,
+                    lambda syms: format_python_category_md(cat_name, cat_desc, matching_paths,
+                                                           modules_by_path, symbols=syms),
+                ))
+
+            # Handle uncategorized modules (modules not matching any folder prefix)
+            if uncategorized:
+                out.write(*cached_fragment(
+                    ("Other Modules", ""), uncategorized,
+                    lambda syms: format_python_uncategorized_md(uncategorized, modules_by_path, symbols=syms),
+                ))
+        else:
+            flat_symbols = []
+            out.write(format_python_flat_md(modules_by_path, symbols=flat_symbols), flat_symbols)
+
+    if cache_path is not None:
+        if folder_map:
+            print(f"  Rebuilt {len(rebuilt)}/{len(fragments)} categories"
+                  + (f": {', '.join(rebuilt)}" if rebuilt else ""))
+        prune_fragments(fragment_dir, {entry["key"] for entry in fragments.values()})
+        save_render_cache(cache_path, {
+            "version": CACHE_VERSION,
+            "generator": generator_hash,
+            "sources": source_hashes,
+            "output": str(output_path.resolve()),
+            "split": split,
+            "outputs": out.outputs,
+            "fragments": fragments,
+        })
 
 
 # ============ TYPESCRIPT (TypeDoc JSON) ============
@@ -768,10 +1392,61 @@ def format_ts_type(type_obj: Any) -> str:
         return "any"
 
 
-def generate_typescript_api(project_dir: str, output_path: str):
-    """Generate API reference markdown for TypeScript using TypeDoc JSON."""
+# Files besides src/ that change what TypeDoc emits. Lockfiles pin the
+# dependency .d.ts files that end up in the reflection.
+TYPEDOC_CONFIG_FILES = ("package.json", "tsconfig.json", "typedoc.json",
+                        "package-lock.json", "yarn.lock", "pnpm-lock.yaml")
+
+
+def get_typedoc_version(project_dir: str) -> str | None:
+    """Read the installed TypeDoc version from node_modules without starting Node. None if not installed."""
+    pkg = Path(project_dir) / "node_modules" / "typedoc" / "package.json"
+    try:
+        return json.loads(pkg.read_text())["version"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def typedoc_cache_key(project_dir: str) -> str | None:
+    """
+    Hash of the src/ tree, TypeDoc-relevant config files and the TypeDoc version.
+    None when TypeDoc is not installed locally: npx would then run whatever version
+    it resolves, which the key cannot account for.
+    """
+    project = Path(project_dir)
+    version = get_typedoc_version(project_dir)
+    if version is None:
+        return None
+    parts = {
+        "src": hash_source_tree(project / "src", pattern="*") if (project / "src").is_dir() else {},
+        "config": {name: hash_file(project / name)
+                   for name in TYPEDOC_CONFIG_FILES if (project / name).is_file()},
+        "typedoc": version,
+    }
+    return hash_bytes(json.dumps(parts, sort_keys=True).encode())
+
+
+def run_typedoc(project_dir: str, cache_dir: str | Path | None = DEFAULT_CACHE_DIR) -> dict:
+    """
+    Run TypeDoc on a project and return its JSON reflection.
+
+    The reflection is cached in cache_dir keyed by typedoc_cache_key(), so a rebuild
+    with unchanged sources skips Node entirely. Pass cache_dir=None to always run TypeDoc.
+    Nothing is cached when TypeDoc is not installed in the project's node_modules.
+    """
     import tempfile
     
+    cache_path = None
+    key = typedoc_cache_key(project_dir) if cache_dir is not None else None
+    if cache_dir is not None and key is None:
+        print(f"TypeDoc is not installed in {project_dir}/node_modules, not caching its JSON")
+    if key is not None:
+        cache_path = Path(cache_dir) / "typedoc" / f"{Path(project_dir).resolve().name}.json"
+        cached = load_render_cache(cache_path)
+        if cached.get("key") == key:
+            print(f"TypeDoc JSON for {project_dir} is up to date, using cache")
+            return cached["data"]
+    
     print(f"Generating TypeDoc JSON for {project_dir}...")
     
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
@@ -795,12 +1470,31 @@ def generate_typescript_api(project_dir: str, output_path: str):
         
         with open(tmp_path) as f:
             data = json.load(f)
-    except Exception as e:
-        print(f"Error running TypeDoc: {e}")
-        sys.exit(1)
     finally:
         Path(tmp_path).unlink(missing_ok=True)
     
+    if cache_path is not None:
+        save_render_cache(cache_path, {"version": CACHE_VERSION, "key": key, "data": data})
+    return data
+
+
+def generate_typescript_api(project_dir: str, output_path: str, data: dict | None = None,
+                            cache_dir: str | Path | None = DEFAULT_CACHE_DIR, split: bool = False):
+    """
+    Generate API reference markdown for TypeScript using TypeDoc JSON.
+
+    If data is given it is used as the TypeDoc reflection instead of running TypeDoc.
+    Each section is streamed to disk as soon as it is rendered (see ReferenceOutput).
+    A symbol index (see write_symbol_index) is written next to the markdown output.
+    With split=True, output_path is a directory of per-section pages.
+    """
+    if data is None:
+        try:
+            data = run_typedoc(project_dir, cache_dir=cache_dir)
+        except Exception as e:
+            print(f"Error running TypeDoc: {e}")
+            sys.exit(1)
+    
     md = []
     project_name = data.get("name", "API")
     md.append(f"# {project_name} API Reference\n")
@@ -813,6 +1507,39 @@ def generate_typescript_api(project_dir: str, output_path: str):
             return " ".join(p.get("text", "") for p in summary)
         return ""
     
+    def format_ts_signature(name, sig):
+        param_strs = []
+        for p in sig.get("parameters", []):
+            pname = p.get("name", "")
+            ptype = format_ts_type(p.get("type"))
+            param_strs.append(f"{pname}: {ptype}")
+        ret_type = format_ts_type(sig.get("type"))
+        return f"function {name}({', '.join(param_strs)}): {ret_type}"
+    
+    symbols = []
+    
+    def index_members(line, parent, children):
+        """Index properties and methods of an interface or class under its heading."""
+        for child in children:
+            cname = child.get("name", "")
+            if child.get("kind") == 2048:
+                if cname.startswith("_"):
+                    continue
+                for sig in child.get("signatures", [])[:1]:
+                    add_symbol(symbols, line, f"{parent}.{cname}", "method",
+                               signature=format_ts_signature(cname, sig), summary=first_line(get_comment(sig)))
+            else:
+                optional = "?" if child.get("flags", {}).get("isOptional", False) else ""
+                add_symbol(symbols, line, f"{parent}.{cname}", "property",
+                           signature=f"{cname}{optional}: {format_ts_type(child.get('type'))}",
+                           summary=first_line(get_comment(child)))
+    
+    def index_interface(iface):
+        name = iface.get("name", "")
+        add_symbol(symbols, len(md), name, "interface", signature=f"interface {name}",
+                   summary=first_line(get_comment(iface)))
+        index_members(len(md), name, iface.get("children", []))
+    
     def gen_function(obj, heading="###"):
         lines = []
         name = obj.get("name", "")
@@ -820,16 +1547,8 @@ def generate_typescript_api(project_dir: str, output_path: str):
         
         sigs = obj.get("signatures", [])
         for sig in sigs:
-            params = sig.get("parameters", [])
-            param_strs = []
-            for p in params:
-                pname = p.get("name", "")
-                ptype = format_ts_type(p.get("type"))
-                param_strs.append(f"{pname}: {ptype}")
-            
-            ret_type = format_ts_type(sig.get("type"))
             lines.append("```typescript")
-            lines.append(f"function {name}({', '.join(param_strs)}): {ret_type}")
+            lines.append(format_ts_signature(name, sig))
             lines.append("```\n")
             
             comment = get_comment(sig)
@@ -844,17 +1563,9 @@ def generate_typescript_api(project_dir: str, output_path: str):
         
         sigs = obj.get("signatures", [])
         for sig in sigs:
-            params = sig.get("parameters", [])
-            param_strs = []
-            for p in params:
-                pname = p.get("name", "")
-                ptype = format_ts_type(p.get("type"))
-                param_strs.append(f"{pname}: {ptype}")
-            
-            ret_type = format_ts_type(sig.get("type"))
             lines.append(f"- `{name}()`")
             lines.append("  ```typescript")
-            lines.append(f"  function {name}({', '.join(param_strs)}): {ret_type}")
+            lines.append(f"  {format_ts_signature(name, sig)}")
             lines.append("  ```")
             
             comment = get_comment(sig)
@@ -1007,125 +1718,475 @@ def generate_typescript_api(project_dir: str, output_path: str):
         else:
             other_variables.append(var)
     
-    # ========== SECTION 1: React Components ==========
-    if react_components:
-        md.append("## React Components\n")
-        md.append("Main components exported by hoodini-viz for building genomic neighborhood visualizations.\n")
+    def flush():
+        """Stream the finished section and start the next one from an empty md."""
+        out.write(md, symbols)
+        md.clear()
+        symbols.clear()
+    
+    with ReferenceOutput(output_path, project_name, split=split) as out:
+        flush()
         
-        # Sort to show HoodiniDashboard first, then HoodiniViz
-        def component_sort_key(c):
-            name = c.get("name", "")
-            if name == "HoodiniDashboard":
-                return (0, name)
-            elif name == "HoodiniViz":
-                return (1, name)
-            return (2, name)
+        # ========== SECTION 1: React Components ==========
+        if react_components:
+            md.append("## React Components\n")
+            md.append("Main components exported by hoodini-viz for building genomic neighborhood visualizations.\n")
         
-        react_components.sort(key=component_sort_key)
+            # Sort to show HoodiniDashboard first, then HoodiniViz
+            def component_sort_key(c):
+                name = c.get("name", "")
+                if name == "HoodiniDashboard":
+                    return (0, name)
+                elif name == "HoodiniViz":
+                    return (1, name)
+                return (2, name)
         
-        for comp in react_components:
-            name = comp.get("name", "")
-            # Find matching props interface
-            props_name = f"{name}Props"
-            props_interface = interface_by_name.get(props_name)
-            md.append(gen_react_component(comp, props_interface))
-    
-    # ========== SECTION 2: Component Props Interfaces ==========
-    props_interfaces = [i for i in interfaces if i.get("name", "").endswith("Props")]
-    config_interfaces = [i for i in interfaces if "Config" in i.get("name", "")]
-    data_interfaces = [i for i in interfaces if i.get("name", "").endswith("Data") or "Data" in i.get("name", "")]
-    other_interfaces = [i for i in interfaces if i not in props_interfaces and i not in config_interfaces and i not in data_interfaces]
-    
-    if props_interfaces:
-        md.append("---\n")
-        md.append("## Component Props\n")
-        md.append("Prop interfaces for the React components.\n")
-        for iface in props_interfaces:
-            md.append(gen_interface(iface, "###"))
-    
-    # ========== SECTION 3: Configuration Interfaces ==========
-    if config_interfaces:
-        md.append("---\n")
-        md.append("## Configuration\n")
-        md.append("Configuration interfaces for customizing visualization behavior.\n")
-        for iface in config_interfaces:
-            md.append(gen_interface(iface, "###"))
-    
-    # ========== SECTION 4: Data Types ==========
-    if data_interfaces:
-        md.append("---\n")
-        md.append("## Data Types\n")
-        md.append("Data structures for passing genomic data to components.\n")
-        for iface in data_interfaces:
-            md.append(gen_interface(iface, "###"))
-    
-    # ========== SECTION 5: Other Interfaces ==========
-    if other_interfaces:
-        md.append("---\n")
-        md.append("## Other Interfaces\n")
-        for iface in other_interfaces:
-            md.append(gen_interface(iface, "###"))
-    
-    # ========== SECTION 6: Type Aliases ==========
-    if type_aliases:
-        md.append("---\n")
-        md.append("## Type Aliases\n")
-        for ta in type_aliases:
-            md.append(gen_type_alias(ta, "###"))
-    
-    # ========== SECTION 7: Model Classes ==========
-    if classes:
-        md.append("---\n")
-        md.append("## Model Classes\n")
-        md.append("Internal model classes for representing genomic data structures.\n")
-        for cls in classes:
-            md.append(gen_class(cls, "###"))
-    
-    # ========== SECTION 8: Utility Functions ==========
-    if functions:
-        md.append("---\n")
-        md.append("## Utility Functions\n")
-        for func in functions:
-            md.append(gen_function(func, "###"))
-    
-    # ========== SECTION 9: Constants ==========
-    if other_variables:
-        md.append("---\n")
-        md.append("## Constants\n")
-        for var in other_variables:
-            name = var.get("name", "")
-            vtype = format_ts_type(var.get("type"))
-            comment = get_comment(var)
+            react_components.sort(key=component_sort_key)
+        
+            for comp in react_components:
+                name = comp.get("name", "")
+                # Find matching props interface
+                props_name = f"{name}Props"
+                props_interface = interface_by_name.get(props_name)
+                add_symbol(symbols, len(md), name, "component", signature=f"<{name} />",
+                           summary=first_line(get_comment(comp)))
+                md.append(gen_react_component(comp, props_interface))
+            flush()
+    
+        # ========== SECTION 2: Component Props Interfaces ==========
+        props_interfaces = [i for i in interfaces if i.get("name", "").endswith("Props")]
+        config_interfaces = [i for i in interfaces if "Config" in i.get("name", "")]
+        data_interfaces = [i for i in interfaces if i.get("name", "").endswith("Data") or "Data" in i.get("name", "")]
+        other_interfaces = [i for i in interfaces if i not in props_interfaces and i not in config_interfaces and i not in data_interfaces]
+    
+        if props_interfaces:
+            md.append("---\n")
+            md.append("## Component Props\n")
+            md.append("Prop interfaces for the React components.\n")
+            for iface in props_interfaces:
+                index_interface(iface)
+                md.append(gen_interface(iface, "###"))
+            flush()
+    
+        # ========== SECTION 3: Configuration Interfaces ==========
+        if config_interfaces:
+            md.append("---\n")
+            md.append("## Configuration\n")
+            md.append("Configuration interfaces for customizing visualization behavior.\n")
+            for iface in config_interfaces:
+                index_interface(iface)
+                md.append(gen_interface(iface, "###"))
+            flush()
+    
+        # ========== SECTION 4: Data Types ==========
+        if data_interfaces:
+            md.append("---\n")
+            md.append("## Data Types\n")
+            md.append("Data structures for passing genomic data to components.\n")
+            for iface in data_interfaces:
+                index_interface(iface)
+                md.append(gen_interface(iface, "###"))
+            flush()
+    
+        # ========== SECTION 5: Other Interfaces ==========
+        if other_interfaces:
+            md.append("---\n")
+            md.append("## Other Interfaces\n")
+            for iface in other_interfaces:
+                index_interface(iface)
+                md.append(gen_interface(iface, "###"))
+            flush()
+    
+        # ========== SECTION 6: Type Aliases ==========
+        if type_aliases:
+            md.append("---\n")
+            md.append("## Type Aliases\n")
+            for ta in type_aliases:
+                add_symbol(symbols, len(md), ta.get("name", ""), "type",
+                           signature=f"type {ta.get('name', '')} = {format_ts_type(ta.get('type'))}",
+                           summary=first_line(get_comment(ta)))
+                md.append(gen_type_alias(ta, "###"))
+            flush()
+    
+        # ========== SECTION 7: Model Classes ==========
+        if classes:
+            md.append("---\n")
+            md.append("## Model Classes\n")
+            md.append("Internal model classes for representing genomic data structures.\n")
+            for cls in classes:
+                add_symbol(symbols, len(md), cls.get("name", ""), "class", signature=f"class {cls.get('name', '')}",
+                           summary=first_line(get_comment(cls)))
+                index_members(len(md), cls.get("name", ""),
+                              [c for c in cls.get("children", []) if c.get("kind") in (1024, 2048)])
+                md.append(gen_class(cls, "###"))
+            flush()
+    
+        # ========== SECTION 8: Utility Functions ==========
+        if functions:
+            md.append("---\n")
+            md.append("## Utility Functions\n")
+            for func in functions:
+                sigs = func.get("signatures", [])
+                add_symbol(symbols, len(md), func.get("name", ""), "function",
+                           signature=format_ts_signature(func.get("name", ""), sigs[0]) if sigs else "",
+                           summary=first_line(get_comment(sigs[0])) if sigs else "")
+                md.append(gen_function(func, "###"))
+            flush()
+    
+        # ========== SECTION 9: Constants ==========
+        if other_variables:
+            md.append("---\n")
+            md.append("## Constants\n")
+            for var in other_variables:
+                name = var.get("name", "")
+                vtype = format_ts_type(var.get("type"))
+                comment = get_comment(var)
             
-            md.append(f"### `{name}`\n")
-            md.append("```typescript")
-            md.append(f"const {name}: {vtype}")
-            md.append("```\n")
-            if comment:
-                md.append(comment + "\n")
-    
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    Path(output_path).write_text("\n".join(md))
-    print(f"Generated {output_path}")
+                add_symbol(symbols, len(md), name, "constant", signature=f"const {name}: {vtype}",
+                           summary=first_line(comment))
+                md.append(f"### `{name}`\n")
+                md.append("```typescript")
+                md.append(f"const {name}: {vtype}")
+                md.append("```\n")
+                if comment:
+                    md.append(comment + "\n")
+            flush()
+
+
+# ============ BATCH (manifest) ============
+
+def load_manifest(manifest_path: str) -> list[dict]:
+    """
+    Load a batch manifest. Relative paths are resolved against the manifest's directory.
+
+    Format: {"targets": [{"name": ..., "python": PACKAGE, "search_path": DIR, "output": FILE},
+                         {"name": ..., "typescript": PROJECT_DIR, "output": FILE}]}
+    A target with "split": true writes a directory of pages to "output" instead.
+    """
+    manifest_path = Path(manifest_path)
+    base_dir = manifest_path.resolve().parent
+    manifest = json.loads(manifest_path.read_text())
+
+    targets = []
+    for entry in manifest.get("targets", []):
+        target = dict(entry)
+        if "python" in target:
+            target["kind"] = "python"
+            target["search_path"] = str(base_dir / target["search_path"])
+        elif "typescript" in target:
+            target["kind"] = "typescript"
+            target["typescript"] = str(base_dir / target["typescript"])
+        else:
+            raise ValueError(f"Manifest target needs 'python' or 'typescript': {entry}")
+        target["output"] = str(base_dir / target["output"])
+        target.setdefault("split", False)
+        target.setdefault("name", target.get("python") or Path(target["typescript"]).name)
+        targets.append(target)
+    return targets
+
+
+def generate_from_manifest(manifest_path: str, cache_dir: str | Path | None = DEFAULT_CACHE_DIR) -> list[dict]:
+    """
+    Render every target of a manifest in a single process.
+
+    TypeDoc subprocesses are started first and run in background threads while the
+    Python packages are loaded and rendered with griffe. Returns per-target timings.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    targets = load_manifest(manifest_path)
+    ts_targets = [t for t in targets if t["kind"] == "typescript"]
+    timings = []
+
+    def timed_typedoc(project_dir):
+        start = time.perf_counter()
+        data = run_typedoc(project_dir, cache_dir=cache_dir)
+        return data, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max(len(ts_targets), 1)) as pool:
+        typedoc_jobs = {t["name"]: pool.submit(timed_typedoc, t["typescript"]) for t in ts_targets}
+
+        for target in targets:
+            if target["kind"] != "python":
+                continue
+            start = time.perf_counter()
+            error = None
+            try:
+                generate_python_api(target["python"], [target["search_path"]], target["output"],
+                                    cache_dir=cache_dir, split=target["split"])
+            except Exception as e:
+                error = str(e)
+                print(f"Error generating {target['name']}: {e}")
+            timings.append({"name": target["name"], "kind": "python",
+                            "seconds": time.perf_counter() - start, "error": error})
+
+        for target in ts_targets:
+            error = None
+            typedoc_seconds = None
+            try:
+                data, typedoc_seconds = typedoc_jobs[target["name"]].result()
+                render_start = time.perf_counter()
+                generate_typescript_api(target["typescript"], target["output"], data=data,
+                                        split=target["split"])
+                render_seconds = time.perf_counter() - render_start
+            except Exception as e:
+                error = str(e)
+                render_seconds = None
+                print(f"Error running TypeDoc for {target['name']}: {e}")
+            timings.append({"name": target["name"], "kind": "typescript",
+                            "seconds": (typedoc_seconds or 0) + (render_seconds or 0),
+                            "typedoc_seconds": typedoc_seconds, "render_seconds": render_seconds,
+                            "error": error})
+
+    return timings
+
+
+def print_timings(timings: list[dict], total_seconds: float):
+    print("\nTarget timings:")
+    for t in timings:
+        detail = ""
+        if t["kind"] == "typescript" and t["typedoc_seconds"] is not None:
+            detail = f" (typedoc {t['typedoc_seconds']:.2f}s, render {t['render_seconds'] or 0:.2f}s)"
+        status = "FAILED" if t["error"] else "ok"
+        print(f"  {t['name']:<20} {t['kind']:<11} {t['seconds']:7.2f}s{detail} {status}")
+    print(f"  {'total (wall)':<32} {total_seconds:7.2f}s")
+
+
+# ============ WATCH ============
+
+def source_mtimes(root: Path, pattern: str = "*.py") -> dict[str, int]:
+    """Modification times of every file matching pattern under root. Returns {relative_posix_path: mtime_ns}."""
+    root = Path(root)
+    if root.is_file():
+        return {root.name: root.stat().st_mtime_ns}
+    mtimes = {}
+    for p in root.rglob(pattern):
+        if "__pycache__" in p.parts:
+            continue
+        try:
+            mtimes[p.relative_to(root).as_posix()] = p.stat().st_mtime_ns
+        except OSError:
+            # Deleted between the listing and the stat (editors swapping files on save)
+            continue
+    return mtimes
+
+
+def syntax_errors(root: Path) -> dict[str, SyntaxError]:
+    """
+    Files under root that do not parse. griffe skips such modules silently, so a
+    package loaded while one of them is broken would just lack that module.
+    """
+    import ast
+
+    root = Path(root)
+    files = [root] if root.is_file() else [p for p in sorted(root.rglob("*.py")) if "__pycache__" not in p.parts]
+    errors = {}
+    for p in files:
+        try:
+            ast.parse(p.read_bytes(), filename=str(p))
+        except SyntaxError as e:
+            errors[p.name if root.is_file() else p.relative_to(root).as_posix()] = e
+    return errors
+
+
+def reload_python_modules(loader, root, package_dir: Path, changed: list[str]):
+    """
+    Re-visit edited source files and swap the new griffe modules into the loaded
+    package, keeping their submodules.
+
+    Returns (root, hashes, errors): the (possibly new) root module, or None when a
+    file does not map to a loaded module and a full reload is needed; the hashes of
+    the re-visited files; and {path: error} for files that failed to parse, whose
+    previous version stays in the tree along with its source lines.
+    """
+    from griffe import Module, visit
+
+    by_file = {}
+
+    def index(mod):
+        if isinstance(mod.filepath, Path):
+            by_file[mod.filepath.resolve()] = mod
+        for member in mod.members.values():
+            if not member.is_alias and isinstance(member, Module):
+                index(member)
+
+    index(root)
+
+    hashes = {}
+    errors = {}
+    for rel in changed:
+        filepath = (package_dir / rel).resolve() if package_dir.is_dir() else package_dir
+        old = by_file.get(filepath)
+        if old is None:
+            return None, {}, {}
+
+        data = old.filepath.read_bytes()
+        code = data.decode()
+        try:
+            new = visit(
+                old.name, old.filepath, code,
+                parent=old.parent,
+                extensions=loader.extensions,
+                docstring_parser=loader.docstring_parser,
+                docstring_options=loader.docstring_options,
+                lines_collection=loader.lines_collection,
+                modules_collection=loader.modules_collection,
+            )
+        except SyntaxError as e:
+            errors[rel] = e
+            continue
+
+        # Line numbers in the tree index these lines: only replace them together with the module
+        loader.lines_collection[old.filepath] = code.splitlines(keepends=False)
+
+        # A package's __init__.py does not declare its submodules; carry them over
+        for name, member in old.members.items():
+            if not member.is_alias and isinstance(member, Module):
+                new.set_member(name, member)
+
+        if old.parent is None:
+            root = new
+        else:
+            old.parent.set_member(old.name, new)
+        by_file[filepath] = new
+        hashes[rel] = hash_bytes(data)
+    return root, hashes, errors
+
+
+def watch_python_api(package_name: str, search_paths: list[str], output_path: str,
+                     cache_dir: str | Path | None = DEFAULT_CACHE_DIR, split: bool = False,
+                     interval: float = 0.2):
+    """
+    Regenerate a Python reference every time one of the package's source files changes.
+
+    The griffe package stays loaded between rebuilds: edited modules are re-visited and
+    swapped into the tree, and the package is only reloaded from scratch when files are
+    added or removed. With the render cache only the categories of the edited modules
+    are re-rendered, and unchanged pages are not rewritten, so the dev server reloads
+    just the affected page. Changes are detected by polling mtimes every interval
+    seconds. Runs until interrupted.
+
+    A file that fails to parse mid-edit keeps its last good version in the tree, and
+    fragments stay keyed by that version. A full reload waits until every file parses,
+    keeping the last good output meanwhile.
+    """
+    from griffe import GriffeLoader
+
+    package_dir = find_package_dir(package_name, search_paths)
+    if package_dir is None:
+        print(f"Error: package {package_name} not found in {', '.join(search_paths)}")
+        sys.exit(1)
+
+    loader = module = None
+    loaded_sources = {}  # hashes of the files the loaded tree was built from
+    broken = {}  # files that currently fail to parse
+
+    def rebuild(changed: list[str] | None):
+        """Bring the tree up to date and regenerate. changed=None forces a full reload."""
+        nonlocal loader, module, loaded_sources, broken
+        root = None
+        if changed is not None and module is not None:
+            root, hashes, errors = reload_python_modules(loader, module, package_dir, changed)
+            if root is not None:
+                module = root
+                loaded_sources.update(hashes)
+                broken = {rel: e for rel, e in broken.items() if rel not in changed}
+                broken.update(errors)
+        if root is None:
+            broken = syntax_errors(package_dir)
+            if not broken:
+                print(f"Loading Python package {package_name}...")
+                loaded_sources = hash_source_tree(package_dir)
+                loader = GriffeLoader(search_paths=search_paths)
+                module = loader.load(package_name)
+
+        for rel, e in broken.items():
+            print(f"Error: {rel}:{e.lineno}: {e.msg}")
+        if broken and root is None:
+            print("Keeping the last good output until every file parses again")
+            return False
+        generate_python_api(package_name, search_paths, output_path, cache_dir=cache_dir, split=split,
+                            module=module, loaded_sources=loaded_sources)
+        return True
+
+    mtimes = source_mtimes(package_dir)
+    reload_pending = not rebuild(None)
+    print(f"Watching {package_dir} for changes (Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = source_mtimes(package_dir)
+            if current == mtimes:
+                continue
+
+            start = time.perf_counter()
+            changed = sorted(p for p in current if p in mtimes and current[p] != mtimes[p])
+            added_or_removed = set(current) != set(mtimes)
+            mtimes = current
+            print(f"\nChanged: {', '.join(changed) or 'files added or removed'}")
+            try:
+                full = added_or_removed or reload_pending
+                reload_pending = not rebuild(None if full else changed)
+            except Exception as e:
+                # The tree may be half updated; start over from disk on the next change
+                print(f"Error: {type(e).__name__}: {e}")
+                reload_pending = True
+                continue
+            if not reload_pending:
+                print(f"Rebuilt in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
 
 
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Generate API markdown from source code")
-    parser.add_argument("--python", "-p", nargs=2, metavar=("PACKAGE", "SEARCH_PATH"), 
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--python", "-p", nargs=2, metavar=("PACKAGE", "SEARCH_PATH"), 
                         help="Generate Python docs: package name and search path")
-    parser.add_argument("--typescript", "-t", metavar="PROJECT_DIR",
+    target.add_argument("--typescript", "-t", metavar="PROJECT_DIR",
                         help="Generate TypeScript docs: project directory")
-    parser.add_argument("--output", "-o", required=True, help="Output markdown file path")
+    target.add_argument("--manifest", "-m", metavar="MANIFEST",
+                        help="Generate every target listed in a JSON manifest in one run")
+    parser.add_argument("--output", "-o", help="Output markdown file path (a directory with --split)")
+    parser.add_argument("--split", action="store_true",
+                        help="Write one page per category plus an index page instead of a single file")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help="Directory for the render and TypeDoc JSON caches (default: .cache/api-docs)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-render everything and rerun TypeDoc, without reading or writing caches")
+    parser.add_argument("--watch", "-w", action="store_true",
+                        help="With --python, keep running and regenerate whenever a source file changes")
     
     args = parser.parse_args()
-    
-    if args.python:
-        generate_python_api(args.python[0], [args.python[1]], args.output)
-    elif args.typescript:
-        generate_typescript_api(args.typescript, args.output)
+    cache_dir = None if args.no_cache else args.cache_dir
+    
+    if args.watch and not args.python:
+        parser.error("--watch is only supported with --python")
+    
+    if args.manifest:
+        # Outputs and split mode come from the manifest entries
+        if args.output or args.split:
+            parser.error("--output and --split cannot be used with --manifest (set them per target in the manifest)")
+        start = time.perf_counter()
+        timings = generate_from_manifest(args.manifest, cache_dir=cache_dir)
+        print_timings(timings, time.perf_counter() - start)
+        if any(t["error"] for t in timings):
+            sys.exit(1)
+        return
+    
+    if not args.output:
+        parser.error("--output is required with --python or --typescript")
+    
+    if args.python and args.watch:
+        watch_python_api(args.python[0], [args.python[1]], args.output, cache_dir=cache_dir,
+                         split=args.split)
+    elif args.python:
+        generate_python_api(args.python[0], [args.python[1]], args.output, cache_dir=cache_dir,
+                            split=args.split)
     else:
-        parser.error("Must specify either --python or --typescript")
+        generate_typescript_api(args.typescript, args.output, cache_dir=cache_dir, split=args.split)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import fs from 'fs-extra';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import { execSync } from 'child_process';
+import crypto from 'crypto';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 const rootDir = path.join(__dirname, '..');
@@ -15,6 +16,13 @@ const rootDir = path.join(__dirname, '..');
 const GITHUB_ORG = 'pentamorfico';
 const GITHUB_BRANCH = 'main';
 
+// Sync configuration
+// SYNC_DOCS_SOURCE_DIR reads <dir>/<repo>/<path> from disk instead of GitHub (offline runs, testing)
+const SYNC_SOURCE_DIR = process.env.SYNC_DOCS_SOURCE_DIR ? path.resolve(process.env.SYNC_DOCS_SOURCE_DIR) : null;
+const SYNC_CONCURRENCY = Math.max(1, parseInt(process.env.SYNC_DOCS_CONCURRENCY || '8', 10) || 8);
+const MANIFEST_VERSION = 1;
+const manifestPath = path.join(rootDir, '.cache/sync-docs-manifest.json');
+
 // Try to get token from gh CLI first, then fall back to env variable
 function getGitHubToken() {
   // First try environment variable
@@ -36,9 +44,9 @@ function getGitHubToken() {
   return null;
 }
 
-const GITHUB_TOKEN = getGitHubToken();
+const GITHUB_TOKEN = SYNC_SOURCE_DIR ? null : getGitHubToken();
 
-if (!GITHUB_TOKEN) {
+if (!GITHUB_TOKEN && !SYNC_SOURCE_DIR) {
   console.warn('⚠️  No GitHub authentication found. Private repos will not be accessible.');
   console.warn('   Run: gh auth login');
   console.warn('   Or set: export GITHUB_TOKEN=ghp_your_token_here\n');
@@ -116,136 +124,297 @@ function escapeMdxSpecialChars(content) {
 }
 
 /**
- * Fetch a file from GitHub raw content
+ * Run async tasks with at most `concurrency` of them in flight at once.
+ * Only wrap leaf network calls with it: a task that awaits other limited
+ * tasks while holding a slot can deadlock the pool.
+ */
+function createLimiter(concurrency) {
+  let active = 0;
+  const queue = [];
+
+  const next = () => {
+    if (active >= concurrency || queue.length === 0) return;
+    active++;
+    const { fn, resolve, reject } = queue.shift();
+    fn().then(resolve, reject).finally(() => {
+      active--;
+      next();
+    });
+  };
+
+  return (fn) => new Promise((resolve, reject) => {
+    queue.push({ fn, resolve, reject });
+    next();
+  });
+}
+
+const limit = createLimiter(SYNC_CONCURRENCY);
+
+/**
+ * Git blob SHA of a buffer, as reported by the GitHub contents API
+ */
+function gitBlobSha(buffer) {
+  return crypto.createHash('sha1')
+    .update(`blob ${buffer.length}\0`)
+    .update(buffer)
+    .digest('hex');
+}
+
+function hashContent(content) {
+  return crypto.createHash('sha1').update(content).digest('hex');
+}
+
+/**
+ * Fetch layer backed by GitHub (contents API + raw content)
+ * Every source exposes the same three methods:
+ *   listDir(repo, dirPath, etag) -> { notModified, items, etag } or null
+ *   fetchText(repo, filePath)    -> string or null
+ *   fetchBuffer(repo, item)      -> Buffer or null
  */
-async function fetchGitHubFile(repo, filePath) {
-  const url = `https://raw.githubusercontent.com/${GITHUB_ORG}/${repo}/${GITHUB_BRANCH}/${filePath}`;
+function createGitHubSource() {
+  const authHeaders = () => (GITHUB_TOKEN ? { Authorization: `token ${GITHUB_TOKEN}` } : {});
+
+  return {
+    name: `github.com/${GITHUB_ORG}`,
+
+    async listDir(repo, dirPath, etag) {
+      const url = `https://api.github.com/repos/${GITHUB_ORG}/${repo}/contents/${dirPath}?ref=${GITHUB_BRANCH}`;
+      try {
+        const headers = {
+          'Accept': 'application/vnd.github.v3+json',
+          'User-Agent': 'hoodini-docs-sync',
+          ...authHeaders(),
+        };
+        // Conditional request: a 304 does not count against the rate limit
+        if (etag) {
+          headers['If-None-Match'] = etag;
+        }
+        const response = await fetch(url, { headers });
+        if (response.status === 304) {
+          return { notModified: true, items: null, etag };
+        }
+        if (!response.ok) {
+          return null;
+        }
+        return { notModified: false, items: await response.json(), etag: response.headers.get('etag') };
+      } catch (err) {
+        return null;
+      }
+    },
+
+    async fetchText(repo, filePath) {
+      const url = `https://raw.githubusercontent.com/${GITHUB_ORG}/${repo}/${GITHUB_BRANCH}/${filePath}`;
+      try {
+        const response = await fetch(url, { headers: authHeaders() });
+        if (!response.ok) {
+          return null;
+        }
+        return await response.text();
+      } catch (err) {
+        return null;
+      }
+    },
+
+    async fetchBuffer(repo, item) {
+      try {
+        const response = await fetch(item.download_url, { headers: authHeaders() });
+        if (!response.ok) {
+          return null;
+        }
+        return Buffer.from(await response.arrayBuffer());
+      } catch (err) {
+        return null;
+      }
+    },
+  };
+}
+
+/**
+ * Fetch layer backed by a local directory laid out as <baseDir>/<repo>/<path>
+ * Lets the sync run offline (e.g. SYNC_DOCS_SOURCE_DIR=../ to read sibling checkouts)
+ */
+function createLocalSource(baseDir) {
+  return {
+    name: baseDir,
+
+    async listDir(repo, dirPath) {
+      const absDir = path.join(baseDir, repo, dirPath);
+      if (!fs.existsSync(absDir) || !fs.statSync(absDir).isDirectory()) {
+        return null;
+      }
+      const items = fs.readdirSync(absDir, { withFileTypes: true }).map(entry => {
+        const itemPath = path.posix.join(dirPath, entry.name);
+        if (entry.isDirectory()) {
+          return { name: entry.name, path: itemPath, type: 'dir' };
+        }
+        const sha = gitBlobSha(fs.readFileSync(path.join(absDir, entry.name)));
+        return { name: entry.name, path: itemPath, type: 'file', sha };
+      });
+      return { notModified: false, items, etag: null };
+    },
+
+    async fetchText(repo, filePath) {
+      const absPath = path.join(baseDir, repo, filePath);
+      return fs.existsSync(absPath) ? fs.readFileSync(absPath, 'utf-8') : null;
+    },
+
+    async fetchBuffer(repo, item) {
+      const absPath = path.join(baseDir, repo, item.path);
+      return fs.existsSync(absPath) ? fs.readFileSync(absPath) : null;
+    },
+  };
+}
+
+const source = SYNC_SOURCE_DIR ? createLocalSource(SYNC_SOURCE_DIR) : createGitHubSource();
+
+/**
+ * Sync manifest: remembers directory ETags/listings, the blob SHA each local
+ * file was written from, and which files each project owns
+ */
+function loadManifest() {
   try {
-    const headers = {};
-    if (GITHUB_TOKEN) {
-      headers['Authorization'] = `token ${GITHUB_TOKEN}`;
-    }
-    const response = await fetch(url, { headers });
-    if (!response.ok) {
-      return null;
-    }
-    return await response.text();
+    const manifest = fs.readJsonSync(manifestPath);
+    if (manifest.version === MANIFEST_VERSION) return manifest;
   } catch (err) {
-    return null;
+    // Missing or unreadable manifest - start fresh
   }
+  return { version: MANIFEST_VERSION, dirs: {}, files: {}, projects: {} };
+}
+
+function saveManifest(manifest) {
+  fs.outputJsonSync(manifestPath, manifest, { spaces: 2 });
 }
 
+const manifestKey = (localPath) => path.relative(rootDir, localPath).split(path.sep).join('/');
+
 /**
- * Fetch directory listing from GitHub API
+ * True if localPath was written from this blob SHA and has not been edited since
  */
-async function fetchGitHubDir(repo, dirPath) {
-  const url = `https://api.github.com/repos/${GITHUB_ORG}/${repo}/contents/${dirPath}?ref=${GITHUB_BRANCH}`;
-  try {
-    const headers = {
-      'Accept': 'application/vnd.github.v3+json',
-      'User-Agent': 'hoodini-docs-sync'
-    };
-    if (GITHUB_TOKEN) {
-      headers['Authorization'] = `token ${GITHUB_TOKEN}`;
-    }
-    const response = await fetch(url, { headers });
-    if (!response.ok) {
-      return null;
-    }
-    return await response.json();
-  } catch (err) {
-    return null;
+function isUnchanged(manifest, localPath, sha) {
+  const entry = manifest.files[manifestKey(localPath)];
+  if (!entry || !sha || entry.sha !== sha || !fs.existsSync(localPath)) return false;
+  return hashContent(fs.readFileSync(localPath)) === entry.localHash;
+}
+
+function recordFile(manifest, localPath, sha, content) {
+  manifest.files[manifestKey(localPath)] = { sha, localHash: hashContent(content) };
+}
+
+/**
+ * List a directory, reusing the cached listing when GitHub answers 304
+ */
+async function listDir(manifest, repo, dirPath) {
+  const key = `${repo}:${dirPath}`;
+  const cached = manifest.dirs[key];
+  const result = await limit(() => source.listDir(repo, dirPath, cached?.etag));
+  if (!result) return null;
+  if (result.notModified && cached) return cached.items;
+  if (!Array.isArray(result.items)) return result.items;
+
+  const items = result.items.map(({ name, path: itemPath, type, sha, download_url }) => (
+    { name, path: itemPath, type, sha, download_url }
+  ));
+  if (result.etag) {
+    manifest.dirs[key] = { etag: result.etag, items };
   }
+  return items;
 }
 
 /**
  * Recursively download a directory from GitHub
+ * Files and subdirectories are fetched in parallel through the shared limiter;
+ * files whose blob SHA matches the manifest are skipped without a request.
  * Returns { count, remoteFiles } where remoteFiles is a Set of all synced file paths
  */
 async function downloadGitHubDir(repo, remotePath, localPath, options = {}) {
-  const { skipApi = true, skipExisting = true } = options;
+  const { skipApi = true, skipExisting = true, manifest } = options;
   let count = 0;
   const remoteFiles = new Set();
-  
-  const items = await fetchGitHubDir(repo, remotePath);
+
+  const items = await listDir(manifest, repo, remotePath);
   if (!items || !Array.isArray(items)) {
     return { count, remoteFiles };
   }
-  
+
   fs.ensureDirSync(localPath);
-  
-  for (const item of items) {
+
+  const tasks = items.map(async (item) => {
     // Skip hidden files
-    if (item.name.startsWith('.')) continue;
-    
+    if (item.name.startsWith('.')) return;
+
     // Skip api folder if requested
-    if (skipApi && item.name === 'api') continue;
-    
+    if (skipApi && item.name === 'api') return;
+
     const localItemPath = path.join(localPath, item.name);
-    
+
     if (item.type === 'dir') {
       const subResult = await downloadGitHubDir(repo, item.path, localItemPath, options);
       count += subResult.count;
       subResult.remoteFiles.forEach(f => remoteFiles.add(f));
     } else if (item.type === 'file') {
       const ext = path.extname(item.name);
-      
+
       // Handle _meta.json
       if (item.name === '_meta.json') {
         remoteFiles.add(localItemPath);
         if (!fs.existsSync(localItemPath)) {
-          const content = await fetchGitHubFile(repo, item.path);
+          const content = await limit(() => source.fetchText(repo, item.path));
           if (content) {
             fs.writeFileSync(localItemPath, content);
+            recordFile(manifest, localItemPath, item.sha, content);
             count++;
           }
         }
-        continue;
+        return;
       }
-      
+
       // Handle markdown files
       if (['.md', '.mdx'].includes(ext)) {
         let destPath = localItemPath;
         if (ext === '.md') {
           destPath = destPath.replace(/\.md$/, '.mdx');
         }
-        
+
         // Track the file as existing in remote
         remoteFiles.add(destPath);
-        
+
         // Skip if destination already exists (preserve custom content)
         if (skipExisting && fs.existsSync(destPath)) {
-          continue;
+          return;
         }
-        
-        const content = await fetchGitHubFile(repo, item.path);
+
+        // Skip if the remote blob is the one we already wrote
+        if (isUnchanged(manifest, destPath, item.sha)) {
+          return;
+        }
+
+        const content = await limit(() => source.fetchText(repo, item.path));
         if (content) {
           const escapedContent = escapeMdxSpecialChars(content);
           fs.writeFileSync(destPath, escapedContent);
+          recordFile(manifest, destPath, item.sha, escapedContent);
           count++;
         }
       }
-      
+
       // Handle images
       if (['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp'].includes(ext)) {
         const imgDest = path.join(rootDir, 'public/images', item.name);
         remoteFiles.add(imgDest);
         if (!fs.existsSync(imgDest)) {
-          const headers = {};
-          if (GITHUB_TOKEN) {
-            headers['Authorization'] = `token ${GITHUB_TOKEN}`;
-          }
-          const response = await fetch(item.download_url, { headers });
-          if (response.ok) {
-            const buffer = Buffer.from(await response.arrayBuffer());
+          const buffer = await limit(() => source.fetchBuffer(repo, item));
+          if (buffer) {
             fs.writeFileSync(imgDest, buffer);
+            recordFile(manifest, imgDest, item.sha, buffer);
             count++;
           }
         }
       }
     }
-  }
-  
+  });
+
+  await Promise.all(tasks);
+
   return { count, remoteFiles };
 }
 
@@ -368,15 +537,68 @@ function removeOrphanedFiles(localDir, remoteFiles, options = {}) {
   return removed;
 }
 
+/**
+ * Remove files that were synced last time but are gone from remote
+ * Diffs the manifest's previous file list against this run's instead of rescanning
+ * the filesystem; applies the same preservation rules as removeOrphanedFiles()
+ */
+function removeOrphanedFromManifest(localDir, previousFiles, remoteFiles, manifest, options = {}) {
+  const { dryRun = false } = options;
+  let removed = 0;
+
+  const remoteKeys = new Set([...remoteFiles].map(manifestKey));
+
+  for (const key of previousFiles) {
+    if (remoteKeys.has(key)) continue;
+
+    const localPath = path.join(rootDir, key);
+    const relPath = path.relative(localDir, localPath);
+
+    // Only synced docs inside this project are candidates
+    if (relPath.startsWith('..') || path.isAbsolute(relPath)) continue;
+    if (!localPath.endsWith('.mdx')) continue;
+
+    // Skip api and playground folders - generated separately / local-only
+    const topLevel = relPath.split(path.sep)[0];
+    if (topLevel === 'api' || topLevel === 'playground') continue;
+
+    // Don't remove index.mdx if there are no remote docs (it's scaffold)
+    if (path.basename(localPath) === 'index.mdx' && remoteFiles.size === 0) continue;
+
+    delete manifest.files[key];
+    if (!fs.existsSync(localPath)) continue;
+
+    if (!dryRun) fs.unlinkSync(localPath);
+    removed++;
+    console.log(`   🗑️  Removed: ${path.basename(localPath)}`);
+
+    // Remove directories left empty
+    let dir = path.dirname(localPath);
+    while (dir.startsWith(localDir + path.sep) && fs.existsSync(dir) && fs.readdirSync(dir).length === 0) {
+      if (!dryRun) fs.rmdirSync(dir);
+      removed++;
+      dir = path.dirname(dir);
+    }
+  }
+
+  return removed;
+}
+
 // Parse command line arguments
 const args = process.argv.slice(2);
 const forceSync = args.includes('--force') || args.includes('-f');
 
 // Main execution
 async function main() {
-  console.log('🔄 Syncing documentation from GitHub...\n');
-  console.log(`   Organization: ${GITHUB_ORG}`);
-  console.log(`   Branch: ${GITHUB_BRANCH}`);
+  if (SYNC_SOURCE_DIR) {
+    console.log('🔄 Syncing documentation from local directory...\n');
+    console.log(`   Source: ${SYNC_SOURCE_DIR}`);
+  } else {
+    console.log('🔄 Syncing documentation from GitHub...\n');
+    console.log(`   Organization: ${GITHUB_ORG}`);
+    console.log(`   Branch: ${GITHUB_BRANCH}`);
+  }
+  console.log(`   Concurrency: ${SYNC_CONCURRENCY}`);
   if (forceSync) {
     console.log(`   Mode: FORCE (overwriting existing files)`);
   }
@@ -384,26 +606,41 @@ async function main() {
 
   fs.ensureDirSync(path.join(rootDir, 'public/images'));
 
+  const manifest = loadManifest();
+
   for (const project of projects) {
-    console.log(`📦 ${project.name}: Fetching from github.com/${GITHUB_ORG}/${project.repo}...`);
+    console.log(`📦 ${project.name}: Fetching from ${source.name}/${project.repo}...`);
     
     // Download docs from GitHub
     const result = await downloadGitHubDir(project.repo, project.docsPath, project.dest, {
       skipApi: true,
-      skipExisting: !forceSync
+      skipExisting: !forceSync,
+      manifest
     });
     
     // Also try to download images
     const imgResult = await downloadGitHubDir(project.repo, `${project.docsPath}/images`, path.join(rootDir, 'public/images'), {
       skipApi: false,
-      skipExisting: !forceSync
+      skipExisting: !forceSync,
+      manifest
     });
     
     // Merge remote files from both syncs
     const allRemoteFiles = new Set([...result.remoteFiles, ...imgResult.remoteFiles]);
     
-    // Remove orphaned files (files that no longer exist in remote)
-    const removedCount = removeOrphanedFiles(project.dest, allRemoteFiles);
+    // Remove orphaned files (files that no longer exist in remote).
+    // With a previous manifest this is a diff; the first run falls back to a rescan.
+    // An empty listing usually means the fetch failed, so keep the old file list then.
+    const previousFiles = manifest.projects[project.name];
+    let removedCount = 0;
+    if (!previousFiles) {
+      removedCount = removeOrphanedFiles(project.dest, allRemoteFiles);
+    } else if (allRemoteFiles.size > 0) {
+      removedCount = removeOrphanedFromManifest(project.dest, previousFiles, allRemoteFiles, manifest);
+    }
+    if (allRemoteFiles.size > 0 || !previousFiles) {
+      manifest.projects[project.name] = [...allRemoteFiles].map(manifestKey).sort();
+    }
     
     // Ensure scaffold exists
     ensureProjectScaffold(project);
@@ -413,6 +650,8 @@ async function main() {
     console.log(`   ✅ ${syncedMsg}${removedMsg}\n`);
   }
 
+  saveManifest(manifest);
+
   console.log('✨ Sync complete!');
   console.log('\n💡 Note: API reference docs are generated separately.');
   console.log('   Run the full build to regenerate API docs from source code.\n');